@@ -2,23 +2,30 @@
 # ---------------------------------------------------------------------------
 # Convert Picea foliar cover to spruce extent
 # Author: Timm Nawrocki
-# Last Updated: 2023-12-12
+# Last Updated: 2026-10-17
 # Usage: Execute in Python 3.9+.
 # Description: "Convert Picea foliar cover to spruce extent" combines the cover maps for Picea glauca and Picea mariana, thresholds them, and rescales the output data.
 # ---------------------------------------------------------------------------
 
 # Import packages
-import glob
 import os
+import sys
 import time
 import numpy as np
 import rasterio
 from osgeo import gdal
 from akutils import *
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import *
 
 # Set nodata value
 nodata = 255
 
+# Set parallel processing options for warp jobs (set worker count to 1 to run serially)
+worker_count = 3
+worker_cache = 4096  # GDAL cache per worker in MB
+memory_limit = 32768  # Total memory for concurrent warp jobs in MB
+
 # Set root directory
 drive = 'D:/'
 root_folder = 'ACCS_Work'
@@ -30,27 +37,12 @@ foliar_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/AKV
 ecoregion_input = os.path.join(project_folder, 'Data_Input/ecoregion_inputs')
 picgla_folder = os.path.join(foliar_folder, 'picgla/rasters')
 picmar_folder = os.path.join(foliar_folder, 'picmar/rasters')
+tile_index_folder = os.path.join(ecoregion_input, 'tile_index')
 
 # Define input files
 area_input = os.path.join(ecoregion_input, 'AlaskaYukon_MapDomain_10m_3338.tif')
 watershed_input = os.path.join(ecoregion_input, 'Alaska_Watersheds_12Digit_3338.shp')
 
-# Define list of Picea glauca files
-os.chdir(picgla_folder)
-picgla_files = glob.glob('*.tif')
-picgla_list = []
-for file in picgla_files:
-    full_path = os.path.join(picgla_folder, file)
-    picgla_list.append(full_path)
-
-# Define list of Picea mariana files
-os.chdir(picmar_folder)
-picmar_files = glob.glob('*.tif')
-picmar_list = []
-for file in picmar_files:
-    full_path = os.path.join(picmar_folder, file)
-    picmar_list.append(full_path)
-
 # Define output files
 picgla_output = os.path.join(ecoregion_input, 'Picea_glauca_10m.tif')
 picmar_output = os.path.join(ecoregion_input, 'Picea_mariana_10m.tif')
@@ -58,124 +50,95 @@ threshold_output = os.path.join(ecoregion_input, 'Picea_Threshold_5_10m_3338.tif
 picea_output = os.path.join(ecoregion_input, 'Picea_Threshold_5_50m_3338.tif')
 area_output = os.path.join(ecoregion_input, 'AlaskaYukon_MapDomain_50m_3338.tif')
 
-# Calculate area bounds
-area_bounds = raster_bounds(area_input)
+# Define script file for build manifests
+script_file = os.path.abspath(__file__)
 
-# Merge tiles for Picea glauca
-if os.path.exists(picgla_output) == 0:
-    print(f'Merging {len(picgla_files)} tiles for Picea glauca...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(picgla_output,
-              picgla_list,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Byte,
-              workingType=gdal.GDT_Byte,
-              xRes=10,
-              yRes=-10,
-              srcNodata=nodata,
-              dstNodata=nodata,
-              outputBounds=area_bounds,
-              resampleAlg='bilinear',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
+# Define warp registry
+# Entries: job name, output file, input file or tile folder, cell size, resampling method, phase
+# Phases: 'inputs' runs before the picea threshold is applied, 'threshold' runs after it
+warp_registry = [
+    ('Picea glauca', picgla_output, picgla_folder, 10, 'bilinear', 'inputs'),
+    ('Picea mariana', picmar_output, picmar_folder, 10, 'bilinear', 'inputs'),
+    ('map domain', area_output, area_input, 50, 'near', 'inputs'),
+    ('Picea threshold', picea_output, threshold_output, 50, 'near', 'threshold')
+]
 
-# Merge tiles for Picea mariana
-if os.path.exists(picmar_output) == 0:
-    print(f'Merging {len(picmar_files)} tiles for Picea mariana...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(picmar_output,
-              picmar_list,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Byte,
-              workingType=gdal.GDT_Byte,
-              xRes=10,
-              yRes=-10,
-              srcNodata=nodata,
-              dstNodata=nodata,
-              outputBounds=area_bounds,
-              resampleAlg='bilinear',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
+# Guard processing so that spawned pool workers do not rerun the script
+if __name__ == '__main__':
 
-# Combine picea cover and apply threshold using blocked read/write
-if os.path.exists(threshold_output) == 0:
-    print(f'Apply picea cover threshold...')
-    iteration_start = time.time()
-    input_raster = rasterio.open(picgla_output)
-    input_profile = input_raster.profile.copy()
-    area_raster = rasterio.open(area_input)
-    picgla_raster = rasterio.open(picgla_output)
-    picmar_raster = rasterio.open(picmar_output)
-    with rasterio.open(threshold_output, 'w', **input_profile, BIGTIFF='YES') as dst:
-        # Find number of raster blocks
-        window_list = []
-        for block_index, window in area_raster.block_windows(1):
-            window_list.append(window)
-        # Iterate processing through raster blocks
-        count = 1
-        progress = 0
-        for block_index, window in area_raster.block_windows(1):
-            area_block = area_raster.read(window=window,
-                                          masked=False)
-            picgla_block = picgla_raster.read(window=window,
-                                              masked=False)
-            picmar_block = picmar_raster.read(window=window,
-                                              masked=False)
-            # Add block data
-            raster_block = picmar_block + picgla_block
-            # Set no data values in input raster to 0
-            raster_block = np.where((raster_block >= 5) & (raster_block <= 150), 1, 0)
-            # Write results
-            dst.write(raster_block,
-                      window=window)
-            # Report progress
-            count, progress = raster_block_progress(100, len(window_list), count, progress)
-    end_timing(iteration_start)
+    # Calculate area bounds
+    area_bounds = raster_bounds(area_input)
+
+    # Define warp jobs from registry
+    warp_jobs = []
+    for job_name, warp_output, warp_inputs, cell_size, resample_method, warp_phase in warp_registry:
+        # Define list of tiles that intersect the area bounds for tile folders
+        if os.path.isdir(warp_inputs):
+            tile_index = os.path.join(tile_index_folder, os.path.basename(os.path.dirname(warp_inputs)) + '.json')
+            warp_inputs = intersecting_tiles(tile_footprints(warp_inputs, tile_index), area_bounds)
+        warp_options = {'srcSRS': 'EPSG:3338',
+                        'dstSRS': 'EPSG:3338',
+                        'outputType': gdal.GDT_Byte,
+                        'workingType': gdal.GDT_Byte,
+                        'xRes': cell_size,
+                        'yRes': -cell_size,
+                        'srcNodata': nodata,
+                        'dstNodata': nodata,
+                        'outputBounds': area_bounds,
+                        'resampleAlg': resample_method,
+                        'targetAlignedPixels': False,
+                        'creationOptions': ['COMPRESS=LZW', 'BIGTIFF=YES']}
+        warp_jobs.append({'name': job_name,
+                          'output': warp_output,
+                          'inputs': warp_inputs,
+                          'options': warp_options,
+                          'phase': warp_phase})
 
-# Resample threshold raster to final output
-if os.path.exists(picea_output) == 0:
-    print(f'Resampling output threshold file...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(picea_output,
-              threshold_output,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Byte,
-              workingType=gdal.GDT_Byte,
-              xRes=50,
-              yRes=-50,
-              srcNodata=nodata,
-              dstNodata=nodata,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
+    # Merge tiles and resample map domain
+    schedule_warp_jobs([job for job in warp_jobs if job['phase'] == 'inputs'
+                        and prepare_build(job['output'], job['inputs'], job['options'])],
+                       worker_count, worker_cache, memory_limit)
+
+    # Combine picea cover and apply threshold using blocked read/write
+    threshold_inputs = [area_input, picgla_output, picmar_output, script_file]
+    if prepare_build(threshold_output, threshold_inputs, {'nodata': nodata}) == True:
+        print(f'Apply picea cover threshold...')
+        iteration_start = time.time()
+        stage_start = start_metrics()
+        input_raster = rasterio.open(picgla_output)
+        input_profile = input_raster.profile.copy()
+        area_raster = rasterio.open(area_input)
+        picgla_raster = rasterio.open(picgla_output)
+        picmar_raster = rasterio.open(picmar_output)
+        with rasterio.open(threshold_output, 'w', **input_profile, BIGTIFF='YES') as dst:
+            # Find number of raster blocks
+            window_list = []
+            for block_index, window in area_raster.block_windows(1):
+                window_list.append(window)
+            # Iterate processing through raster blocks
+            count = 1
+            progress = 0
+            for block_index, window in area_raster.block_windows(1):
+                area_block = area_raster.read(window=window,
+                                              masked=False)
+                picgla_block = picgla_raster.read(window=window,
+                                                  masked=False)
+                picmar_block = picmar_raster.read(window=window,
+                                                  masked=False)
+                # Add block data
+                raster_block = picmar_block + picgla_block
+                # Set no data values in input raster to 0
+                raster_block = np.where((raster_block >= 5) & (raster_block <= 150), 1, 0)
+                # Write results
+                dst.write(raster_block,
+                          window=window)
+                # Report progress
+                count, progress = raster_block_progress(100, len(window_list), count, progress)
+        record_build(threshold_output, threshold_inputs, {'nodata': nodata})
+        write_metrics(collect_metrics('threshold', threshold_output, threshold_inputs, stage_start, blocks=len(window_list)))
+        end_timing(iteration_start)
 
-# Resample area raster to final output
-if os.path.exists(area_output) == 0:
-    print(f'Resampling area raster...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(area_output,
-              area_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Byte,
-              workingType=gdal.GDT_Byte,
-              xRes=50,
-              yRes=-50,
-              srcNodata=nodata,
-              dstNodata=nodata,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
+    # Resample threshold raster to final output
+    schedule_warp_jobs([job for job in warp_jobs if job['phase'] == 'threshold'
+                        and prepare_build(job['output'], job['inputs'], job['options'])],
+                       worker_count, worker_cache, memory_limit)
@@ -2,18 +2,21 @@
 # ---------------------------------------------------------------------------
 # Create vegetation zone raster
 # Author: Timm Nawrocki
-# Last Updated: 2023-12-12
+# Last Updated: 2026-10-17
 # Usage: Execute in Python 3.9+.
 # Description: "Create vegetation zone raster" combines vegetation zones and the spruce extent vector..
 # ---------------------------------------------------------------------------
 
 # Import packages
 import os
+import sys
 import time
 import numpy as np
 import rasterio
 from osgeo import gdal
 from akutils import *
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import *
 
 # Set nodata value
 nodata = -32768
@@ -33,6 +36,7 @@ area_input = os.path.join(ecoregion_folder, 'AlaskaYukon_MapDomain_50m_3338.tif'
 tnp_input = os.path.join(zones_folder, 'TemperateNorthPacific_ModelArea_3338.shp')
 spruce_input = os.path.join(zones_folder, 'AlaskaYukon_SpruceExtent_3338.shp')
 zones_input = os.path.join(zones_folder, 'Alaska_VegetationZones_Initial.shp')
+rules_input = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zone_rules.json')
 
 # Define intermediate files
 tnp_intermediate = os.path.join(intermediate_folder, 'TemperateNorthPacific_ModelArea_50m_3338.tif')
@@ -42,15 +46,20 @@ zones_intermediate = os.path.join(intermediate_folder, 'Alaska_VegetationZones_I
 # Define output files
 zones_output = os.path.join(intermediate_folder, 'AlaskaYukon_VegetationZones_50m_3338.tif')
 
+# Define script file for build manifests
+script_file = os.path.abspath(__file__)
+
 #### PROCESS RASTER CONVERSIONS
 
 # Calculate area bounds
 area_bounds = raster_bounds(area_input)
 
 # Convert Temperate North Pacific region
-if os.path.exists(tnp_intermediate) == 0:
+tnp_sources = [tnp_input, os.path.splitext(tnp_input)[0] + '.dbf', script_file]
+if prepare_build(tnp_intermediate, tnp_sources, {'outputBounds': area_bounds}) == True:
     print('Converting Temperate North Pacific region to raster...')
     iteration_start = time.time()
+    stage_start = start_metrics()
     # Open the data source
     tnp_vector = gdal.OpenEx(tnp_input)
     # Rasterize the vector
@@ -67,12 +76,16 @@ if os.path.exists(tnp_intermediate) == 0:
                    yRes=50,
                    allTouched=True,
                    attribute='value')
+    record_build(tnp_intermediate, tnp_sources, {'outputBounds': area_bounds})
+    write_metrics(collect_metrics('tnp_intermediate', tnp_intermediate, tnp_sources, stage_start))
     end_timing(iteration_start)
 
 # Convert spruce extent to raster
-if os.path.exists(spruce_intermediate) == 0:
+spruce_sources = [spruce_input, os.path.splitext(spruce_input)[0] + '.dbf', script_file]
+if prepare_build(spruce_intermediate, spruce_sources, {'outputBounds': area_bounds}) == True:
     print('Converting spruce extent polygon to raster...')
     iteration_start = time.time()
+    stage_start = start_metrics()
     # Open the data source
     spruce_vector = gdal.OpenEx(spruce_input)
     # Rasterize the vector
@@ -89,12 +102,16 @@ if os.path.exists(spruce_intermediate) == 0:
                    yRes=50,
                    allTouched=True,
                    attribute='value')
+    record_build(spruce_intermediate, spruce_sources, {'outputBounds': area_bounds})
+    write_metrics(collect_metrics('spruce_intermediate', spruce_intermediate, spruce_sources, stage_start))
     end_timing(iteration_start)
 
 # Convert initial zones to raster
-if os.path.exists(zones_intermediate) == 0:
+zones_sources = [zones_input, os.path.splitext(zones_input)[0] + '.dbf', script_file]
+if prepare_build(zones_intermediate, zones_sources, {'outputBounds': area_bounds}) == True:
     print('Converting initial zones to raster...')
     iteration_start = time.time()
+    stage_start = start_metrics()
     # Open the data source
     zones_vector = gdal.OpenEx(zones_input)
     # Rasterize the vector
@@ -111,93 +128,54 @@ if os.path.exists(zones_intermediate) == 0:
                    yRes=50,
                    allTouched=True,
                    attribute='value')
+    record_build(zones_intermediate, zones_sources, {'outputBounds': area_bounds})
+    write_metrics(collect_metrics('zones_intermediate', zones_intermediate, zones_sources, stage_start))
     end_timing(iteration_start)
 
 #### DELINEATE VEGETATION ZONES
 
+# Define build inputs
+zones_inputs = [area_input, tnp_intermediate, spruce_intermediate, zones_intermediate, rules_input, script_file]
+
 # Combine data sources using blocked read/write
-print('Delineating vegetation zones...')
-iteration_start = time.time()
-tnp_raster = rasterio.open(tnp_intermediate)
-spruce_raster = rasterio.open(spruce_intermediate)
-zones_raster = rasterio.open(zones_intermediate)
-input_profile = zones_raster.profile.copy()
-area_raster = rasterio.open(area_input)
-with rasterio.open(zones_output, 'w', **input_profile, BIGTIFF='YES') as dst:
-    # Find number of raster blocks
-    window_list = []
-    for block_index, window in area_raster.block_windows(1):
-        window_list.append(window)
-    # Iterate processing through raster blocks
-    count = 1
-    progress = 0
-    for block_index, window in area_raster.block_windows(1):
-        area_block = area_raster.read(window=window,
-                                      masked=False)
-        tnp_block = tnp_raster.read(window=window,
-                                    masked=False)
-        spruce_block = spruce_raster.read(window=window,
+if prepare_build(zones_output, zones_inputs, {'nodata': nodata}) == True:
+    print('Delineating vegetation zones...')
+    iteration_start = time.time()
+    stage_start = start_metrics()
+    zone_rules = compile_rules(rules_input)
+    tnp_raster = rasterio.open(tnp_intermediate)
+    spruce_raster = rasterio.open(spruce_intermediate)
+    zones_raster = rasterio.open(zones_intermediate)
+    input_profile = zones_raster.profile.copy()
+    area_raster = rasterio.open(area_input)
+    with rasterio.open(zones_output, 'w', **input_profile, BIGTIFF='YES') as dst:
+        # Find number of raster blocks
+        window_list = []
+        for block_index, window in area_raster.block_windows(1):
+            window_list.append(window)
+        # Iterate processing through raster blocks
+        count = 1
+        progress = 0
+        for block_index, window in area_raster.block_windows(1):
+            area_block = area_raster.read(window=window,
                                           masked=False)
-        zones_block = zones_raster.read(window=window,
+            tnp_block = tnp_raster.read(window=window,
                                         masked=False)
-        # Create alternate values for initial zones
-        zones_block = np.where(zones_block != nodata,
-                               zones_block + 100,
-                               nodata)
-        # Set initial values
-        raster_block = np.where((tnp_block == 1) & (zones_block == nodata),
-                                1,
-                                zones_block)
-        # Set temperate-boreal
-        raster_block = np.where(raster_block == 102,
-                                2,
-                                raster_block)
-        # Set southern boreal
-        raster_block = np.where(raster_block == 103,
-                                3,
-                                raster_block)
-        # Set central boreal
-        raster_block = np.where(raster_block == 104,
-                                4,
-                                raster_block)
-        # Set northern boreal
-        raster_block = np.where((spruce_block == 20) &
-                                ((raster_block == 106) | (raster_block == 107)),
-                                5,
-                                raster_block)
-        # Set northern Arctic
-        raster_block = np.where((raster_block == 106) | (raster_block == 107),
-                                12,
-                                raster_block)
-        # Set western boreal
-        raster_block = np.where((spruce_block == 20) &
-                                ((raster_block == 108) | (raster_block == 109)),
-                                6,
-                                raster_block)
-        # Set western Arctic
-        raster_block = np.where((raster_block == 108) | (raster_block == 109),
-                                11,
-                                raster_block)
-        # Set southwest boreal
-        raster_block = np.where((spruce_block == 20) &
-                                ((raster_block == 119) | (raster_block == 122)),
-                                7,
-                                raster_block)
-        # Set southwest Arctic transition
-        raster_block = np.where(raster_block == 119,
-                                10,
-                                raster_block)
-        # Set southwest maritime transition
-        raster_block = np.where(raster_block == 122,
-                                8,
-                                raster_block)
-        # Set maritime
-        raster_block = np.where((raster_block == 112) | (raster_block == 113),
-                                9,
-                                raster_block)
-        # Write results
-        dst.write(raster_block,
-                  window=window)
-        # Report progress
-        count, progress = raster_block_progress(100, len(window_list), count, progress)
-end_timing(iteration_start)
+            spruce_block = spruce_raster.read(window=window,
+                                              masked=False)
+            zones_block = zones_raster.read(window=window,
+                                            masked=False)
+            # Create alternate values for initial zones
+            zones_block = np.where(zones_block != nodata,
+                                   zones_block + 100,
+                                   nodata)
+            # Apply zone rules in order
+            raster_block = apply_rules(zone_rules, zones_block, {'tnp': tnp_block, 'spruce': spruce_block})
+            # Write results
+            dst.write(raster_block,
+                      window=window)
+            # Report progress
+            count, progress = raster_block_progress(100, len(window_list), count, progress)
+    record_build(zones_output, zones_inputs, {'nodata': nodata})
+    write_metrics(collect_metrics('zones', zones_output, zones_inputs, stage_start, blocks=len(window_list)))
+    end_timing(iteration_start)
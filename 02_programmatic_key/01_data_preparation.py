@@ -2,17 +2,36 @@
 # ---------------------------------------------------------------------------
 # Prepare data for processing
 # Author: Timm Nawrocki
-# Last Updated: 2024-01-27
+# Last Updated: 2026-10-17
 # Usage: Execute in Python 3.9+.
 # Description: "Prepare data for processing" enforces a common grid, cell size, and extent on all raster input data.
 # ---------------------------------------------------------------------------
 
 # Import packages
-import glob
 import os
+import sys
 import time
 from osgeo import gdal
 from akutils import *
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import *
+
+# Set parallel processing options for warp jobs (set worker count to 1 to run serially)
+worker_count = 8
+worker_cache = 2048  # GDAL cache per worker in MB
+memory_limit = 32768  # Total memory for concurrent warp jobs in MB
+
+# Set storage type for foliar cover layers ('uint8' stores values 0 to 254 with 255 as no data, 'int16' uses -32768)
+cover_storage = 'int16'
+cover_type = gdal.GDT_Byte if cover_storage == 'uint8' else gdal.GDT_Int16
+cover_nodata = 255 if cover_storage == 'uint8' else -32768
+
+# Set foliar cover mosaic options ('tif' copies output tiles into one tiled GeoTIFF, 'vrt' references the tiles)
+mosaic_format = 'tif'
+mosaic_tile_size = 4096  # Output tile width and height in cells
+
+# Set standardized input format ('tif' writes GeoTIFFs, 'vrt' writes warped VRTs that are read on demand)
+standard_format = 'tif'
 
 # Set root directory
 drive = 'D:/'
@@ -25,10 +44,10 @@ foliar_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/AKV
                              'Data_Output/data_package/version_1.0_20210517')
 output_folder = os.path.join(project_folder, 'Data_Input/akveg_foliar_30m')
 intermediate_folder = os.path.join(project_folder, 'Data_Input/intermediate')
+tile_index_folder = os.path.join(project_folder, 'Data_Input/tile_index')
 
 # Define input files
 area_input = os.path.join(project_folder, 'Data_Input/Landfire_AKVEG_Automated_Domain_30m_3338.tif')
-lfdomain_input = os.path.join(project_folder, 'Data_Input/Landfire_Domain_30m_3338.tif')
 abovedomain_input = os.path.join(project_folder, 'Data_Input/workspace/ABoVE_Domain_30m_3338.tif')
 landfire_input = os.path.join(project_folder, 'Data_Input/landfire_evt/LA16_EVT_200.tif')
 zones_input = os.path.join(project_folder, 'Data_Output/zones/AlaskaYukon_VegetationZones_30m_3338.tif')
@@ -37,263 +56,148 @@ subboreal_input = os.path.join(project_folder, 'Data_Output/zones/Alaska_Ecologi
 correction_input = os.path.join(project_folder, 'Data_Input/ancillary/Correction_BlackMixedSpruce_30m_3338.tif')
 elevation_input = os.path.join(topography_folder, 'Elevation_10m_3338.tif')
 
-# Define output files
-landfire_output = os.path.join(intermediate_folder, 'LA16_EVT_200.tif')
-zones_output = os.path.join(intermediate_folder, 'AlaskaYukon_VegetationZones_30m_3338.tif')
-biomes_output = os.path.join(intermediate_folder, 'AlaskaYukon_Biomes_30m_3338.tif')
-subboreal_output = os.path.join(intermediate_folder, 'Alaska_EcologicalSystems_Subboreal_30m_3338.tif')
-checkdomain_output = os.path.join(intermediate_folder, 'Landfire_AKVEG_Automated_FullZone_30m_3338.tif')
-abovedomain_output = os.path.join(intermediate_folder, 'ABoVE_Domain_30m_3338.tif')
-correction_output = os.path.join(intermediate_folder, 'Correction_BlackMixedSpruce_30m_3338.tif')
-elevation_output = os.path.join(intermediate_folder, 'Elevation_30m_3338.tif')
-
 # Define foliar cover input lists
 species_list = ['alnus', 'betshr', 'bettre', 'dectre', 'dryas', 'empnig', 'erivag',
                 'picgla', 'picmar', 'rhoshr', 'salshr', 'sphagn', 'vaculi', 'vacvit', 'wetsed']
 pft_list = ['ConiferTree', 'DeciduousShrub', 'EvergreenShrub', 'Forb', 'Graminoid', 'tmLichenLight']
 pft_outnames = ['contre', 'decshr', 'evrshr', 'forb', 'gramin', 'lichen']
 
-# Calculate area bounds
-area_bounds = raster_bounds(area_input)
-
-# Process foliar cover species/aggregate input data in loop
-for input_name in species_list:
-    # Define input folder
-    input_folder = os.path.join(foliar_folder, input_name, 'rasters')
-
-    # Define output file
-    foliar_output = os.path.join(output_folder, input_name + '_30m_3338.tif')
-
-    # Define list of input files
-    os.chdir(input_folder)
-    file_list = glob.glob('*.tif')
-    foliar_inputs = []
-    for file in file_list:
-        full_path = os.path.join(input_folder, file)
-        foliar_inputs.append(full_path)
-
-    # Merge tiles
-    if os.path.exists(foliar_output) == 0:
-        print(f'Merging {len(foliar_inputs)} tiles for {input_name}...')
-        iteration_start = time.time()
-        # Merge tiles
-        gdal.Warp(foliar_output,
-                  foliar_inputs,
-                  srcSRS='EPSG:3338',
-                  dstSRS='EPSG:3338',
-                  outputType=gdal.GDT_Int16,
-                  workingType=gdal.GDT_Byte,
-                  xRes=30,
-                  yRes=-30,
-                  srcNodata=255,
-                  dstNodata=-32768,
-                  outputBounds=area_bounds,
-                  resampleAlg='average',
-                  targetAlignedPixels=False,
-                  creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-        end_timing(iteration_start)
-
-# Process foliar cover plant functional type input data in loop
-count = 0
-for input_name in pft_list:
-    # Define input folder
-    foliar_input = os.path.join(drive, root_folder,
-                                'Data/biota/vegetation/Alaska_PFT_TimeSeries/projected_3338',
-                                f'ABoVE_PFT_Top_Cover_{input_name}_2020_3338.tif')
-
-    # Define output file
-    foliar_output = os.path.join(output_folder, pft_outnames[count] + '_30m_3338.tif')
-
-    # Merge tiles
-    if os.path.exists(foliar_output) == 0:
-        print(f'Warping {input_name}...')
-        iteration_start = time.time()
-        # Merge tiles
-        gdal.Warp(foliar_output,
-                  foliar_input,
-                  srcSRS='EPSG:3338',
-                  dstSRS='EPSG:3338',
-                  outputType=gdal.GDT_Int16,
-                  workingType=gdal.GDT_Byte,
-                  xRes=30,
-                  yRes=-30,
-                  srcNodata=255,
-                  dstNodata=-32768,
-                  outputBounds=area_bounds,
-                  resampleAlg='near',
-                  targetAlignedPixels=False,
-                  creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-        end_timing(iteration_start)
-
-    count += 1
-
-# Process landfire input data
-if os.path.exists(landfire_output) == 0:
-    print(f'Standardizing Landfire EVT...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(landfire_output,
-              landfire_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Int16,
-              xRes=30,
-              yRes=-30,
-              srcNodata=32767,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Process zones input data
-if os.path.exists(zones_output) == 0:
-    print(f'Standardizing zones...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(zones_output,
-              zones_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Byte,
-              xRes=30,
-              yRes=-30,
-              srcNodata=255,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Process biomes input data
-if os.path.exists(biomes_output) == 0:
-    print(f'Standardizing biomes...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(biomes_output,
-              biomes_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Byte,
-              xRes=30,
-              yRes=-30,
-              srcNodata=255,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Process sub-boreal input data
-if os.path.exists(subboreal_output) == 0:
-    print(f'Standardizing sub-boreal zone...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(subboreal_output,
-              subboreal_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Byte,
-              xRes=30,
-              yRes=-30,
-              srcNodata=255,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Process black-mixed spruce correction input data
-if os.path.exists(correction_output) == 0:
-    print(f'Standardizing black-mixed spruce correction zone...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(correction_output,
-              correction_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Byte,
-              xRes=30,
-              yRes=-30,
-              srcNodata=255,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Process elevation input data
-if os.path.exists(elevation_output) == 0:
-    print(f'Standardizing elevation data...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(elevation_output,
-              elevation_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Int16,
-              xRes=30,
-              yRes=-30,
-              srcNodata=-32768,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='average',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Process ABoVE domain input data
-if os.path.exists(abovedomain_output) == 0:
-    print(f'Standardizing ABoVE domain data...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(abovedomain_output,
-              abovedomain_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Int16,
-              xRes=30,
-              yRes=-30,
-              srcNodata=-32768,
-              dstNodata=-32768,
-              outputBounds=area_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
-
-# Calculate landfire domain bounds
-landfire_bounds = raster_bounds(lfdomain_input)
-
-# Process automated zone input data
-if os.path.exists(checkdomain_output) == 0:
-    print(f'Standardizing automated check zone...')
-    iteration_start = time.time()
-    # Merge tiles
-    gdal.Warp(checkdomain_output,
-              area_input,
-              srcSRS='EPSG:3338',
-              dstSRS='EPSG:3338',
-              outputType=gdal.GDT_Int16,
-              workingType=gdal.GDT_Byte,
-              xRes=30,
-              yRes=-30,
-              srcNodata=255,
-              dstNodata=-32768,
-              outputBounds=landfire_bounds,
-              resampleAlg='near',
-              targetAlignedPixels=False,
-              creationOptions=['COMPRESS=LZW', 'BIGTIFF=YES'])
-    end_timing(iteration_start)
+# Define standardized input registry
+# Entries: output name, input file, source no data, working type, resampling method, bounds raster
+standard_registry = [
+    ('LA16_EVT_200', landfire_input, 32767, gdal.GDT_Int16, 'near', area_input),
+    ('AlaskaYukon_VegetationZones_30m_3338', zones_input, 255, gdal.GDT_Byte, 'near', area_input),
+    ('AlaskaYukon_Biomes_30m_3338', biomes_input, 255, gdal.GDT_Byte, 'near', area_input),
+    ('Alaska_EcologicalSystems_Subboreal_30m_3338', subboreal_input, 255, gdal.GDT_Byte, 'near', area_input),
+    ('Correction_BlackMixedSpruce_30m_3338', correction_input, 255, gdal.GDT_Byte, 'near', area_input),
+    ('Elevation_30m_3338', elevation_input, -32768, gdal.GDT_Int16, 'average', area_input),
+    ('ABoVE_Domain_30m_3338', abovedomain_input, -32768, gdal.GDT_Int16, 'near', area_input)
+]
+
+# Define output options for standardized inputs
+if standard_format == 'vrt':
+    standard_options = {'format': 'VRT'}
+else:
+    standard_options = {'format': 'GTiff', 'creationOptions': ['COMPRESS=LZW', 'BIGTIFF=YES']}
+
+# Guard processing so that spawned pool workers do not rerun the script
+if __name__ == '__main__':
+
+    # Read optional area of interest
+    aoi = read_aoi()
+    output_folder = aoi_folder(output_folder, aoi)
+    intermediate_folder = aoi_folder(intermediate_folder, aoi)
+
+    # Calculate area bounds
+    area_bounds = aoi_bounds(area_input, aoi)
+
+    # Define foliar cover species/aggregate warp jobs for each output tile
+    warp_jobs = []
+    mosaic_list = []
+    for input_name in species_list:
+        # Define input folder
+        input_folder = os.path.join(foliar_folder, input_name, 'rasters')
+
+        # Define output file and tile folder
+        foliar_output = os.path.join(output_folder, input_name + '_30m_3338.' + mosaic_format)
+        tile_folder = os.path.join(output_folder, 'tiles', input_name)
+
+        # Index tile footprints once and list input files that intersect the area bounds
+        tile_index = os.path.join(tile_index_folder, input_name + '.json')
+        footprints = tile_footprints(input_folder, tile_index)
+        foliar_inputs = intersecting_tiles(footprints, area_bounds)
+        if len(foliar_inputs) == 0:
+            print(f'No {input_name} tiles intersect the area bounds.')
+            continue
+
+        # Add merge jobs for output tiles
+        warp_options = {'srcSRS': 'EPSG:3338',
+                        'dstSRS': 'EPSG:3338',
+                        'outputType': cover_type,
+                        'workingType': gdal.GDT_Byte,
+                        'xRes': 30,
+                        'yRes': -30,
+                        'srcNodata': 255,
+                        'dstNodata': cover_nodata,
+                        'outputBounds': area_bounds,
+                        'resampleAlg': 'average',
+                        'targetAlignedPixels': False,
+                        'creationOptions': ['COMPRESS=LZW', 'BIGTIFF=YES']}
+        mosaic_job = {'name': input_name,
+                      'output': foliar_output,
+                      'inputs': foliar_inputs,
+                      'options': warp_options}
+        tile_outputs = []
+        for tile_job in tile_warp_jobs(mosaic_job, mosaic_tile_size, tile_folder, footprints):
+            tile_outputs.append(tile_job['output'])
+            if prepare_build(tile_job['output'], tile_job['inputs'], tile_job['options']) == True:
+                warp_jobs.append(tile_job)
+        mosaic_list.append((input_name, foliar_output, tile_outputs))
+
+    # Define foliar cover plant functional type warp jobs
+    count = 0
+    for input_name in pft_list:
+        # Define input folder
+        foliar_input = os.path.join(drive, root_folder,
+                                    'Data/biota/vegetation/Alaska_PFT_TimeSeries/projected_3338',
+                                    f'ABoVE_PFT_Top_Cover_{input_name}_2020_3338.tif')
+
+        # Define output file
+        foliar_output = os.path.join(output_folder, pft_outnames[count] + '_30m_3338.tif')
+
+        # Add warp job
+        warp_options = {'srcSRS': 'EPSG:3338',
+                        'dstSRS': 'EPSG:3338',
+                        'outputType': cover_type,
+                        'workingType': gdal.GDT_Byte,
+                        'xRes': 30,
+                        'yRes': -30,
+                        'srcNodata': 255,
+                        'dstNodata': cover_nodata,
+                        'outputBounds': area_bounds,
+                        'resampleAlg': 'near',
+                        'targetAlignedPixels': False,
+                        'creationOptions': ['COMPRESS=LZW', 'BIGTIFF=YES']}
+        if prepare_build(foliar_output, foliar_input, warp_options) == True:
+            warp_jobs.append({'name': input_name,
+                              'output': foliar_output,
+                              'inputs': foliar_input,
+                              'options': warp_options})
+
+        count += 1
+
+    # Define standardized input warp jobs from registry
+    for output_name, standard_input, source_nodata, working_type, resample_method, bounds_input in standard_registry:
+        standard_output = os.path.join(intermediate_folder, output_name + '.' + standard_format)
+        warp_options = {'srcSRS': 'EPSG:3338',
+                        'dstSRS': 'EPSG:3338',
+                        'outputType': gdal.GDT_Int16,
+                        'workingType': working_type,
+                        'xRes': 30,
+                        'yRes': -30,
+                        'srcNodata': source_nodata,
+                        'dstNodata': -32768,
+                        'outputBounds': aoi_bounds(bounds_input, aoi),
+                        'resampleAlg': resample_method,
+                        'targetAlignedPixels': False,
+                        **standard_options}
+        if prepare_build(standard_output, standard_input, warp_options) == True:
+            warp_jobs.append({'name': output_name,
+                              'output': standard_output,
+                              'inputs': standard_input,
+                              'options': warp_options})
+
+    # Run warp jobs
+    schedule_warp_jobs(warp_jobs, worker_count, worker_cache, memory_limit)
+
+    # Assemble foliar cover tiles
+    for input_name, foliar_output, tile_outputs in mosaic_list:
+        mosaic_parameters = {'bounds': area_bounds, 'nodata': cover_nodata}
+        if prepare_build(foliar_output, tile_outputs, mosaic_parameters) == True:
+            print(f'Assembling {len(tile_outputs)} tiles of {input_name}...')
+            iteration_start = time.time()
+            stage_start = start_metrics()
+            mosaic_tiles(tile_outputs, foliar_output, area_bounds, cover_nodata)
+            record_build(foliar_output, tile_outputs, mosaic_parameters)
+            write_metrics(collect_metrics(input_name + '_mosaic', foliar_output, tile_outputs, stage_start))
+            end_timing(iteration_start)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Build feature cube
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Execute in Python 3.9+.
+# Description: "Build feature cube" packs the foliar, materialized derived, and ancillary layers read by the programmatic key into a single tiled multi-band raster, which is band-interleaved in place of the original pixel-interleaved layout so that the key decodes only the bands it reads.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+import time
+import numpy as np
+import rasterio
+from akutils import *
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import *
+
+# Set no data value
+nodata = -32768
+
+# Set cube tile size (must be a multiple of 16) and GDAL cache in MB for reading striped inputs
+cube_block_size = 512
+cube_cache = 8192
+
+# Set band interleaving of the feature cube ('band' stores each layer in its own tiles so that the key decodes only the bands it reads, 'pixel' restores the original layout with one tile read per window)
+cube_interleave = 'band'
+
+# Set whether to tune block window shapes to the layouts of the inputs (False uses the native blocks of the feature cube)
+window_tuning = True
+
+# Set root directory
+drive = 'D:/'
+root_folder = 'ACCS_Work'
+
+# Read optional area of interest
+aoi = read_aoi()
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/Landfire_BpS/Data')
+foliar_folder = aoi_folder(os.path.join(project_folder, 'Data_Input/akveg_foliar_30m'), aoi)
+derived_folder = aoi_folder(os.path.join(project_folder, 'Data_Input/akveg_derived_30m'), aoi)
+intermediate_folder = aoi_folder(os.path.join(project_folder, 'Data_Input/intermediate'), aoi)
+
+# Define input files
+area_input = os.path.join(project_folder, 'Data_Input/Landfire_AKVEG_Automated_Domain_30m_3338.tif')
+
+# Window full-extent inputs to area of interest
+run_bounds = aoi_bounds(area_input, aoi)
+area_input = aoi_raster(area_input, aoi, run_bounds)
+
+# Define output file
+cube_output = os.path.join(intermediate_folder, 'AKVEG_FeatureCube_30m_3338.tif')
+
+# Define cube layers
+# Entries: band name, input file
+cube_layers = [
+    ('area', area_input),
+    ('above', standardized_path(os.path.join(intermediate_folder, 'ABoVE_Domain_30m_3338.tif'))),
+    ('biomes', standardized_path(os.path.join(intermediate_folder, 'AlaskaYukon_Biomes_30m_3338.tif'))),
+    ('zones', standardized_path(os.path.join(intermediate_folder, 'AlaskaYukon_VegetationZones_30m_3338.tif'))),
+    ('subboreal', standardized_path(os.path.join(intermediate_folder,
+                                                 'Alaska_EcologicalSystems_Subboreal_30m_3338.tif'))),
+    ('correction', standardized_path(os.path.join(intermediate_folder, 'Correction_BlackMixedSpruce_30m_3338.tif'))),
+    ('elevation', standardized_path(os.path.join(intermediate_folder, 'Elevation_30m_3338.tif'))),
+    ('alnus', standardized_path(os.path.join(foliar_folder, 'alnus_30m_3338.tif'))),
+    ('betshr', standardized_path(os.path.join(foliar_folder, 'betshr_30m_3338.tif'))),
+    ('bettre', standardized_path(os.path.join(foliar_folder, 'bettre_30m_3338.tif'))),
+    ('contre', standardized_path(os.path.join(foliar_folder, 'contre_30m_3338.tif'))),
+    ('dectre', standardized_path(os.path.join(foliar_folder, 'dectre_30m_3338.tif'))),
+    ('dryas', standardized_path(os.path.join(foliar_folder, 'dryas_30m_3338.tif'))),
+    ('erivag', standardized_path(os.path.join(foliar_folder, 'erivag_30m_3338.tif'))),
+    ('picmar', standardized_path(os.path.join(foliar_folder, 'picmar_30m_3338.tif'))),
+    ('salshr', standardized_path(os.path.join(foliar_folder, 'salshr_30m_3338.tif'))),
+    ('sphagn', standardized_path(os.path.join(foliar_folder, 'sphagn_30m_3338.tif'))),
+    ('wetsed', standardized_path(os.path.join(foliar_folder, 'wetsed_30m_3338.tif'))),
+    ('evrshr', standardized_path(os.path.join(foliar_folder, 'evrshr_30m_3338.tif'))),
+    ('forb', standardized_path(os.path.join(foliar_folder, 'forb_30m_3338.tif'))),
+    ('gramin', standardized_path(os.path.join(foliar_folder, 'gramin_30m_3338.tif'))),
+    ('lichen', standardized_path(os.path.join(foliar_folder, 'lichen_30m_3338.tif'))),
+    ('picgla', standardized_path(os.path.join(foliar_folder, 'picgla_30m_3338.tif'))),
+    ('empnig', standardized_path(os.path.join(foliar_folder, 'empnig_30m_3338.tif'))),
+    ('rhoshr', standardized_path(os.path.join(foliar_folder, 'rhoshr_30m_3338.tif'))),
+    ('vacvit', standardized_path(os.path.join(foliar_folder, 'vacvit_30m_3338.tif'))),
+    ('decshr', standardized_path(os.path.join(foliar_folder, 'decshr_30m_3338.tif')))
+]
+
+# Pack completed materialized derived layers, which the key otherwise calculates per block from the foliar cover layers
+for layer_name, description, layer_output, expression, lower, upper, layer_storage in derived_layers(derived_folder):
+    if os.path.exists(layer_output) and os.path.exists(layer_output + '.build.json'):
+        cube_layers.append((layer_name, layer_output))
+
+# Define script file for build manifests
+script_file = os.path.abspath(__file__)
+
+# Define build inputs
+cube_inputs = [layer_input for layer_name, layer_input in cube_layers] + [script_file]
+cube_parameters = {'nodata': nodata, 'bands': [layer_name for layer_name, layer_input in cube_layers],
+                   'block_size': cube_block_size, 'interleave': cube_interleave}
+
+# Pack layers into feature cube
+if prepare_build(cube_output, cube_inputs, cube_parameters) == True:
+    print(f'Packing {len(cube_layers)} layers into feature cube...')
+    iteration_start = time.time()
+    stage_start = start_metrics()
+    with rasterio.Env(GDAL_CACHEMAX=cube_cache):
+        layer_rasters = [rasterio.open(layer_input) for layer_name, layer_input in cube_layers]
+        cube_profile = layer_rasters[0].profile.copy()
+        cube_profile.update(driver='GTiff',
+                            count=len(cube_layers),
+                            dtype='int16',
+                            nodata=nodata,
+                            compress='lzw',
+                            predictor=2,
+                            interleave=cube_interleave,
+                            tiled=True,
+                            blockxsize=cube_block_size,
+                            blockysize=cube_block_size,
+                            BIGTIFF='YES')
+        with rasterio.open(cube_output, 'w', **cube_profile) as dst:
+            # Name bands so that readers select layers by name
+            for band, (layer_name, layer_input) in enumerate(cube_layers, start=1):
+                dst.set_band_description(band, layer_name)
+            # Find raster blocks to process
+            window_shape = tune_windows(dst, [layer_input for layer_name, layer_input in cube_layers]) \
+                if window_tuning == True else None
+            window_list = aoi_windows(dst, aoi, window_shape)
+            # Iterate processing through raster blocks
+            count = 1
+            progress = 0
+            for window in window_list:
+                cube_block = np.empty((len(cube_layers), window.height, window.width), dtype=np.int16)
+                for band, layer_raster in enumerate(layer_rasters):
+                    cube_block[band] = read_cover(layer_raster, window)[0]
+                # Write results
+                dst.write(cube_block,
+                          window=window)
+                # Report progress
+                count, progress = raster_block_progress(100, len(window_list), count, progress)
+        for layer_raster in layer_rasters:
+            layer_raster.close()
+    record_build(cube_output, cube_inputs, cube_parameters)
+    write_metrics(collect_metrics('cube', cube_output, cube_inputs, stage_start, blocks=len(window_list)))
+    end_timing(iteration_start)
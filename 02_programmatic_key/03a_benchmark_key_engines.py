@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Benchmark key engines
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-17
+# Usage: Execute in Python 3.9+. Requires numba for the compiled engine.
+# Description: "Benchmark key engines" times the vectorized and compiled rule engines of the programmatic key on blocks of the feature cube and confirms that their results are identical.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+import time
+import numpy as np
+import rasterio
+from akutils import *
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import *
+
+# Set no data
+nodata = -32768
+
+# Set storage type of derived layers calculated by the key (must match 02_calculate_derived_data)
+cover_storage = 'int16'
+
+# Set number of occupied blocks to benchmark
+sample_blocks = 32
+
+# Set number of timed repeats per engine
+repeats = 3
+
+# Set root directory
+drive = 'D:/'
+root_folder = 'ACCS_Work'
+
+# Read optional area of interest
+aoi = read_aoi()
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/Landfire_BpS/Data')
+intermediate_folder = aoi_folder(os.path.join(project_folder, 'Data_Input/intermediate'), aoi)
+derived_folder = aoi_folder(os.path.join(project_folder, 'Data_Input/akveg_derived_30m'), aoi)
+
+# Define input files
+cube_input = os.path.join(intermediate_folder, 'AKVEG_FeatureCube_30m_3338.tif')
+rules_input = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parse_rules.json')
+
+# Prepare input raster
+cube_raster = rasterio.open(cube_input)
+band_index = {band_name: index for index, band_name in enumerate(cube_raster.descriptions)}
+
+# Find derived layers without a materialized band in the feature cube
+lazy_layers = [layer for layer in derived_layers(derived_folder, cover_storage) if layer[0] not in band_index]
+
+# Compile ordered key rules for both engines
+parse_rules = compile_rules(rules_input)
+print('Compiling key rules with numba...')
+iteration_start = time.time()
+key_function = jit_rules(parse_rules, parallel=True)
+if key_function is None:
+    print('numba is not installed; only the vectorized engine is available.')
+    sys.exit(1)
+
+#### READ SAMPLE BLOCKS
+
+# Read blocks that contain mapped pixels, spread evenly across the area of interest
+print('Reading sample blocks...')
+window_list = aoi_windows(cube_raster, aoi)
+sample_list = []
+for window in window_list[::max(1, len(window_list) // (sample_blocks * 4))]:
+    cube_block = read_window(cube_raster, window)
+    blocks = {band_name: cube_block[index] for band_name, index in band_index.items()}
+    if np.count_nonzero(blocks['area'] == 1) == 0:
+        continue
+    for layer_name, description, layer_output, expression, lower, upper, layer_storage in lazy_layers:
+        blocks[layer_name] = derived_block(expression, blocks, blocks['area'], nodata, lower, upper, layer_storage)
+    base_block = np.where(blocks['area'] == 1, 253, nodata).astype(np.int16)
+    sample_list.append((base_block, blocks))
+    if len(sample_list) == sample_blocks:
+        break
+if len(sample_list) == 0:
+    print('No sampled block contains mapped pixels of the automated domain; there is nothing to benchmark.')
+    sys.exit(1)
+pixel_count = sum(base_block.size for base_block, blocks in sample_list)
+print(f'Read {len(sample_list)} blocks with {pixel_count} pixels.')
+
+# Compile the numba function for the block signature before timing
+key_function(parse_rules, sample_list[0][0].copy(), sample_list[0][1])
+end_timing(iteration_start)
+
+#### TIME RULE ENGINES
+
+# Define a function to apply an engine to every sample block and return the results and best time
+def time_engine(engine):
+    best_time = None
+    for repeat in range(repeats):
+        results = [base_block.copy() for base_block, blocks in sample_list]
+        engine_start = time.perf_counter()
+        for out_block, (base_block, blocks) in zip(results, sample_list):
+            engine(parse_rules, out_block, blocks)
+        engine_time = time.perf_counter() - engine_start
+        best_time = engine_time if best_time is None else min(best_time, engine_time)
+    return results, best_time
+
+# Time engines
+numpy_results, numpy_time = time_engine(apply_rules)
+numba_results, numba_time = time_engine(key_function)
+
+# Confirm identical results
+for numpy_block, numba_block in zip(numpy_results, numba_results):
+    if np.array_equal(numpy_block, numba_block) == False:
+        raise ValueError('Compiled key does not match the vectorized key.')
+
+# Report throughput
+print(f'numpy: {pixel_count / numpy_time / 1e6:.1f} megapixels per second')
+print(f'numba: {pixel_count / numba_time / 1e6:.1f} megapixels per second')
+print(f'Speedup: {numpy_time / numba_time:.2f}x with identical results')
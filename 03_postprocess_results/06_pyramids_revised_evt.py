@@ -2,16 +2,24 @@
 # ---------------------------------------------------------------------------
 # Build pyramids for revised EVT
 # Author: Timm Nawrocki
-# Last Updated: 2024-01-30
+# Last Updated: 2026-10-17
 # Usage: Must be executed in an ArcGIS Pro Python 3.9+ distribution.
-# Description: "Build pyramids for revised EVT" builds pyramid using the "mode" setting.
+# Description: "Build pyramids for revised EVT" builds pyramids using the "mode" setting or publishes copies of the final rasters as cloud optimized GeoTIFFs with embedded mode overviews.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import os
+import sys
 import time
 from osgeo import gdal
 from akutils import *
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import *
+
+# Set publishing format ('cog' writes copies of the final rasters as cloud optimized GeoTIFFs, 'pyramids' adds external overviews)
+publish_format = 'cog'
+cog_compression = 'DEFLATE'
+cog_predictor = 'YES'
 
 # Set version
 version = 'v1.0_20240126'
@@ -25,16 +33,41 @@ project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/La
 output_folder = os.path.join(project_folder,
                              'Data_Output/data_package/data_package_' + version,
                              'Data_Output/final_rasters')
+published_folder = os.path.join(project_folder,
+                                'Data_Output/data_package/data_package_' + version,
+                                'Data_Output/published_rasters')
 
 # Define input datasets
 revised_input = os.path.join(output_folder, 'Landfire_EVT_Revised_30m_3338.tif')
+status_input = os.path.join(output_folder, 'Landfire_EVT_Status_30m_3338.tif')
+
+# Define output datasets
+revised_output = os.path.join(published_folder, 'Landfire_EVT_Revised_30m_3338.tif')
+status_output = os.path.join(published_folder, 'Landfire_EVT_Status_30m_3338.tif')
+
+# Define script file for build manifests
+script_file = os.path.abspath(__file__)
 
-# Build pyramids
-print('Building pyramids...')
-iteration_start = time.time()
-revised_raster = gdal.Open(revised_input, 0)  # 0 = read-only, 1 = read-write.
-gdal.SetConfigOption('COMPRESS_OVERVIEW', 'LZW')
-gdal.SetConfigOption('BIGTIFF_OVERVIEW', 'IF_SAFER')
-revised_raster.BuildOverviews('MODE', [2, 4, 8, 16, 32, 64, 128, 256], gdal.TermProgress_nocb)
-del revised_raster  # close the dataset (Python object and pointers)
-end_timing(iteration_start)
+if publish_format == 'cog':
+    # Publish copies of final rasters as cloud optimized GeoTIFFs, leaving the final rasters and their manifests unchanged
+    cog_parameters = {'compression': cog_compression, 'predictor': cog_predictor}
+    for final_input, final_output in [(revised_input, revised_output), (status_input, status_output)]:
+        cog_inputs = [final_input, script_file]
+        if prepare_build(final_output, cog_inputs, cog_parameters) == True:
+            print(f'Publishing {os.path.basename(final_input)} as cloud optimized GeoTIFF...')
+            iteration_start = time.time()
+            stage_start = start_metrics()
+            publish_cog(final_input, final_output, cog_compression, cog_predictor)
+            record_build(final_output, cog_inputs, cog_parameters)
+            write_metrics(collect_metrics('published', final_output, cog_inputs, stage_start))
+            end_timing(iteration_start)
+else:
+    # Build pyramids
+    print('Building pyramids...')
+    iteration_start = time.time()
+    revised_raster = gdal.Open(revised_input, 0)  # 0 = read-only, 1 = read-write.
+    gdal.SetConfigOption('COMPRESS_OVERVIEW', 'LZW')
+    gdal.SetConfigOption('BIGTIFF_OVERVIEW', 'IF_SAFER')
+    revised_raster.BuildOverviews('MODE', [2, 4, 8, 16, 32, 64, 128, 256], gdal.TermProgress_nocb)
+    del revised_raster  # close the dataset (Python object and pointers)
+    end_timing(iteration_start)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Initialization for lfutils
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Imported by the processing scripts of the Landfire EVT review.
+# Description: "lfutils" collects shared processing functions for the Landfire EVT review that are not general enough for akutils.
+# ---------------------------------------------------------------------------
+
+# Import functions from lfutils
+from lfutils.aggregate_job import aggregate_job
+from lfutils.aligned_profile import aligned_profile
+from lfutils.apply_rules import apply_rules
+from lfutils.aoi_bounds import aoi_bounds
+from lfutils.aoi_folder import aoi_folder
+from lfutils.aoi_raster import aoi_raster
+from lfutils.aoi_windows import aoi_windows
+from lfutils.block_occupancy import block_occupancy
+from lfutils.build_state import build_state
+from lfutils.cache_raster import cache_raster
+from lfutils.collect_metrics import collect_metrics
+from lfutils.compile_rules import compile_rules
+from lfutils.copy_job import copy_job
+from lfutils.derived_block import derived_block
+from lfutils.derived_layers import derived_layers
+from lfutils.evaluate_expression import evaluate_expression
+from lfutils.expression_names import expression_names
+from lfutils.file_fingerprint import file_fingerprint
+from lfutils.grid_alignment import grid_alignment
+from lfutils.intersecting_tiles import intersecting_tiles
+from lfutils.jit_rules import jit_rules
+from lfutils.mosaic_tiles import mosaic_tiles
+from lfutils.output_profile import output_profile
+from lfutils.prepare_build import prepare_build
+from lfutils.process_blocks import process_blocks
+from lfutils.publish_cog import publish_cog
+from lfutils.read_aligned import read_aligned
+from lfutils.read_aoi import read_aoi
+from lfutils.read_cover import read_cover
+from lfutils.read_window import read_window
+from lfutils.record_build import record_build
+from lfutils.rule_layers import rule_layers
+from lfutils.schedule_warp_jobs import schedule_warp_jobs
+from lfutils.set_gdal_cache import set_gdal_cache
+from lfutils.standardized_path import standardized_path
+from lfutils.start_metrics import start_metrics
+from lfutils.store_cover import store_cover
+from lfutils.tile_footprints import tile_footprints
+from lfutils.tile_warp_jobs import tile_warp_jobs
+from lfutils.tune_windows import tune_windows
+from lfutils.warp_job import warp_job
+from lfutils.warp_job_size import warp_job_size
+from lfutils.write_metrics import write_metrics
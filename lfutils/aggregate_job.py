@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Aggregate job
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Aggregate job" is a function that runs an average warp job on integer-factor aligned grids as streamed block means.
+# ---------------------------------------------------------------------------
+
+# Define a function to run an aligned average warp job
+def aggregate_job(job, alignment, strip_rows=128):
+    """
+    Description: writes the output of an average warp job as the no data-aware mean of each factor by factor group of input cells, streaming output row strips so that memory does not depend on raster size
+    Inputs: 'job' -- a job dictionary accepted by warp_job with 'resampleAlg' set to 'average'
+            'alignment' -- a dictionary returned by grid_alignment for the job
+            'strip_rows' -- an integer number of output rows processed at a time
+    Returned Value: Returns the output pixel count
+    Preconditions: later inputs overwrite earlier inputs where they have data and integer means are rounded half up, as in gdal.Warp
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+    from lfutils.aligned_profile import aligned_profile
+
+    # Define output profile
+    options = job['options']
+    factor = alignment['factor']
+    width = alignment['width']
+    height = alignment['height']
+    output_profile = aligned_profile(job, alignment)
+    output_nodata = output_profile['nodata']
+    fill_value = output_nodata if output_nodata is not None else 0
+
+    # Calculate output cells covered by each input
+    sources = []
+    for source in alignment['sources']:
+        sources.append({**source,
+                        'col_start': max(0, source['col_offset'] // factor),
+                        'col_end': min(width, -(-(source['col_offset'] + source['width']) // factor)),
+                        'row_start': max(0, source['row_offset'] // factor),
+                        'row_end': min(height, -(-(source['row_offset'] + source['height']) // factor))})
+
+    # Write output row strips
+    with rasterio.open(job['output'], 'w', **output_profile) as dst:
+        for strip_start in range(0, height, strip_rows):
+            strip_end = min(strip_start + strip_rows, height)
+            strip_block = np.full((strip_end - strip_start, width), fill_value, dtype=output_profile['dtype'])
+            for source in sources:
+                row_start = max(source['row_start'], strip_start)
+                row_end = min(source['row_end'], strip_end)
+                col_start = source['col_start']
+                col_end = source['col_end']
+                if row_start >= row_end or col_start >= col_end:
+                    continue
+
+                # Read input cells of the covered output cells, padding cells outside the input as no data
+                group_rows = (row_end - row_start) * factor
+                group_cols = (col_end - col_start) * factor
+                input_row = row_start * factor - source['row_offset']
+                input_col = col_start * factor - source['col_offset']
+                read_row = max(input_row, 0)
+                read_col = max(input_col, 0)
+                read_window = Window(read_col, read_row,
+                                     min(input_col + group_cols, source['width']) - read_col,
+                                     min(input_row + group_rows, source['height']) - read_row)
+                with rasterio.open(source['input']) as input_raster:
+                    input_block = input_raster.read(1, window=read_window)
+                    input_nodata = options.get('srcNodata', input_raster.nodata)
+                value_block = np.zeros((group_rows, group_cols), dtype=np.float64)
+                valid_block = np.zeros((group_rows, group_cols), dtype=bool)
+                value_view = (slice(read_row - input_row, read_row - input_row + input_block.shape[0]),
+                              slice(read_col - input_col, read_col - input_col + input_block.shape[1]))
+                value_block[value_view] = input_block
+                valid_block[value_view] = True if input_nodata is None else input_block != input_nodata
+
+                # Calculate means of valid input cells in each output cell
+                value_block[~valid_block] = 0
+                group_shape = (row_end - row_start, factor, col_end - col_start, factor)
+                group_total = value_block.reshape(group_shape).sum(axis=(1, 3))
+                group_count = valid_block.reshape(group_shape).sum(axis=(1, 3))
+                group_mean = group_total / np.maximum(group_count, 1)
+                if np.issubdtype(strip_block.dtype, np.integer):
+                    group_mean = np.floor(group_mean + 0.5)
+
+                # Overwrite earlier inputs where the input has data
+                strip_view = strip_block[row_start - strip_start:row_end - strip_start, col_start:col_end]
+                strip_view[group_count > 0] = group_mean[group_count > 0]
+            dst.write(strip_block, 1, window=Window(0, strip_start, width, strip_end - strip_start))
+
+    return width * height
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Aligned profile
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Aligned profile" is a function that translates the options of a warp job on an aligned grid to a rasterio output profile.
+# ---------------------------------------------------------------------------
+
+# Define a function to create the output profile of an aligned warp job
+def aligned_profile(job, alignment):
+    """
+    Description: creates a GeoTIFF profile with the grid, data type, no data value, and creation options that gdal.Warp would use for the job
+    Inputs: 'job' -- a job dictionary accepted by warp_job
+            'alignment' -- a dictionary returned by grid_alignment for the job
+    Returned Value: Returns a rasterio profile dictionary
+    Preconditions: the output type must be a GDAL integer or float type code; without an output type, the data type of the sources is kept as in gdal.Warp
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define output data types by GDAL type code
+    gdal_types = {1: 'uint8', 2: 'uint16', 3: 'int16', 4: 'uint32', 5: 'int32', 6: 'float32', 7: 'float64'}
+
+    # Define output profile
+    options = job['options']
+    if 'outputType' in options:
+        output_type = gdal_types[options['outputType']]
+    else:
+        output_type = np.result_type(*[source['dtype'] for source in alignment['sources']]).name
+    output_profile = {'driver': 'GTiff',
+                      'width': alignment['width'],
+                      'height': alignment['height'],
+                      'count': 1,
+                      'dtype': output_type,
+                      'crs': options['dstSRS'],
+                      'transform': alignment['transform'],
+                      'nodata': options.get('dstNodata')}
+    for creation_option in options.get('creationOptions', []):
+        key, value = creation_option.split('=', 1)
+        output_profile[key] = value
+
+    return output_profile
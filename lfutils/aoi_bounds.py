@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Area of interest bounds
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Area of interest bounds" is a function that calculates the bounds of a run on the grid of a reference raster.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate run bounds
+def aoi_bounds(reference_input, aoi):
+    """
+    Description: calculates the bounds of the reference raster or, for an area of interest, the area of interest bounds snapped outward to the reference grid and clipped to the reference extent
+    Inputs: 'reference_input' -- a path to the raster that defines the grid and full extent
+            'aoi' -- an area of interest returned by read_aoi, or None for a full run
+    Returned Value: Returns a list of [xmin, ymin, xmax, ymax]
+    Preconditions: the area of interest must overlap the reference raster
+    """
+
+    # Import packages
+    import math
+    import rasterio
+
+    # Read reference grid
+    with rasterio.open(reference_input) as reference_raster:
+        full_bounds = reference_raster.bounds
+        cell_x, cell_y = reference_raster.res
+    if aoi is None:
+        return [full_bounds.left, full_bounds.bottom, full_bounds.right, full_bounds.top]
+
+    # Snap area of interest outward to whole cells of the reference grid
+    xmin, ymin, xmax, ymax = aoi['bounds']
+    xmin = full_bounds.left + math.floor((xmin - full_bounds.left) / cell_x) * cell_x
+    xmax = full_bounds.left + math.ceil((xmax - full_bounds.left) / cell_x) * cell_x
+    ymax = full_bounds.top - math.floor((full_bounds.top - ymax) / cell_y) * cell_y
+    ymin = full_bounds.top - math.ceil((full_bounds.top - ymin) / cell_y) * cell_y
+
+    # Clip to reference extent
+    run_bounds = [max(xmin, full_bounds.left), max(ymin, full_bounds.bottom),
+                  min(xmax, full_bounds.right), min(ymax, full_bounds.top)]
+    if run_bounds[0] >= run_bounds[2] or run_bounds[1] >= run_bounds[3]:
+        raise ValueError(f'Area of interest {aoi["name"]} does not overlap {reference_input}.')
+
+    return run_bounds
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Area of interest folder
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Area of interest folder" is a function that redirects a folder of produced data to an area of interest subfolder.
+# ---------------------------------------------------------------------------
+
+# Define a function to redirect a folder of produced data
+def aoi_folder(folder, aoi):
+    """
+    Description: returns the full-run folder or, for an area of interest, an aoi_<name> subfolder of it, so that round outputs stay scoped to their round
+    Inputs: 'folder' -- a path to a folder of data produced by the workflow
+            'aoi' -- an area of interest returned by read_aoi, or None for a full run
+    Returned Value: Returns a path to a folder
+    Preconditions: the area of interest subfolder is created if it does not exist
+    """
+
+    # Import packages
+    import os
+
+    # Return full-run folder
+    if aoi is None:
+        return folder
+
+    # Create area of interest subfolder
+    aoi_subfolder = os.path.join(folder, 'aoi_' + aoi['name'])
+    os.makedirs(aoi_subfolder, exist_ok=True)
+
+    return aoi_subfolder
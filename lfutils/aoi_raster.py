@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Area of interest raster
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Area of interest raster" is a function that windows a full-extent input raster to the bounds of a run.
+# ---------------------------------------------------------------------------
+
+# Define a function to window an input raster to the run bounds
+def aoi_raster(raster_input, aoi, run_bounds):
+    """
+    Description: returns the input raster for a full run or, for an area of interest, a virtual raster that windows the input to the run bounds without resampling
+    Inputs: 'raster_input' -- a path to a full-extent input raster that is read in raster blocks
+            'aoi' -- an area of interest returned by read_aoi, or None for a full run
+            'run_bounds' -- a list of [xmin, ymin, xmax, ymax] returned by aoi_bounds
+    Returned Value: Returns a path to a raster on the run grid
+    Preconditions: the input raster must share the grid used to calculate the run bounds
+    """
+
+    # Import packages
+    import os
+    from lfutils.aoi_folder import aoi_folder
+    from lfutils.prepare_build import prepare_build
+    from lfutils.record_build import record_build
+
+    # Return full-extent input for a full run
+    if aoi is None:
+        return raster_input
+
+    # Window input to run bounds
+    from osgeo import gdal
+    window_output = os.path.join(aoi_folder(os.path.dirname(raster_input), aoi),
+                                 os.path.splitext(os.path.basename(raster_input))[0] + '.vrt')
+    window_parameters = {'bounds': run_bounds}
+    if prepare_build(window_output, raster_input, window_parameters) == True:
+        xmin, ymin, xmax, ymax = run_bounds
+        gdal.Translate(window_output, raster_input, format='VRT', projWin=[xmin, ymax, xmax, ymin])
+        record_build(window_output, raster_input, window_parameters)
+
+    return window_output
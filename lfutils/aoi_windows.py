@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Area of interest windows
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Area of interest windows" is a function that lists the raster blocks to process in a run.
+# ---------------------------------------------------------------------------
+
+# Define a function to list the raster blocks to process
+def aoi_windows(raster, aoi, window_shape=None):
+    """
+    Description: lists the block windows of a raster or windows of a selected shape, keeping only blocks that intersect the polygon of an area of interest when one is defined
+    Inputs: 'raster' -- an open rasterio dataset on the run grid
+            'aoi' -- an area of interest returned by read_aoi, or None for a full run
+            'window_shape' -- an optional (height, width) window shape, such as one returned by tune_windows, used in place of the native block layout
+    Returned Value: Returns a list of rasterio windows
+    Preconditions: blocks that are not listed are not written and remain no data in outputs
+    """
+
+    # Import packages
+    from rasterio.windows import Window, bounds
+
+    # List all blocks
+    if window_shape is None:
+        window_list = [window for block_index, window in raster.block_windows(1)]
+    else:
+        window_height, window_width = window_shape
+        window_list = [Window(col_off, row_off,
+                              min(window_width, raster.width - col_off),
+                              min(window_height, raster.height - row_off))
+                       for row_off in range(0, raster.height, window_height)
+                       for col_off in range(0, raster.width, window_width)]
+    if aoi is None or aoi['geometry'] is None:
+        return window_list
+
+    # Keep blocks that intersect the polygon
+    from osgeo import ogr
+    aoi_geometry = ogr.CreateGeometryFromWkt(aoi['geometry'])
+    polygon_windows = []
+    for window in window_list:
+        xmin, ymin, xmax, ymax = bounds(window, raster.transform)
+        window_ring = ogr.Geometry(ogr.wkbLinearRing)
+        for x, y in [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax), (xmin, ymin)]:
+            window_ring.AddPoint_2D(x, y)
+        window_geometry = ogr.Geometry(ogr.wkbPolygon)
+        window_geometry.AddGeometry(window_ring)
+        if window_geometry.Intersects(aoi_geometry):
+            polygon_windows.append(window)
+
+    return polygon_windows
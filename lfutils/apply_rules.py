@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Apply rules
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Apply rules" is a function that evaluates a compiled ordered rule table over a raster block, updating the output classes in place.
+# ---------------------------------------------------------------------------
+
+# Define a function to apply compiled rules to a block
+def apply_rules(compiled_rules, out_block, blocks, sparse_fraction=0.0625, compact_fraction=0.5):
+    """
+    Description: applies rules in order, each assigning its class to pixels whose current class is in its source classes and whose layers meet all of its conditions; conditions of rules with few source pixels are tested only on those pixels, and conditions of rules with many source pixels are tested into preallocated masks; layers are flattened only when a rule with remaining candidate pixels tests them; pixels whose classes later rules can still change are gathered into compact arrays when they become few, so that later rules test only those pixels before the results are scattered back
+    Inputs: 'compiled_rules' -- a list of rules returned by compile_rules
+            'out_block' -- a contiguous numpy array of current classes that is updated in place
+            'blocks' -- a dictionary of layer names and numpy arrays with the shape of the output block, which may omit the layers of rules that cannot fire on the classes of the block
+            'sparse_fraction' -- the fraction of source pixels below which conditions are tested on gathered pixels
+            'compact_fraction' -- the fraction of active pixels below which pixels that later rules can change are gathered into compact arrays, or 0 to evaluate every rule on the full block
+    Returned Value: Returns the updated output block
+    Preconditions: the results equal applying np.where(source match & conditions, class, out_block) for each rule in order
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Flatten output and layers as views
+    if not out_block.flags['C_CONTIGUOUS']:
+        raise ValueError('Output block must be contiguous to be updated in place.')
+    out_values = out_block.reshape(-1)
+    block_layers = {}
+    layer_values = {}
+
+    # Find the classes that each rule and the following rules can change before the next rule without source classes
+    remaining_sources = [None] * len(compiled_rules)
+    segment_sources = set()
+    for index in range(len(compiled_rules) - 1, -1, -1):
+        if compiled_rules[index]['sources'] is None:
+            segment_sources = set()
+        else:
+            segment_sources = segment_sources | set(compiled_rules[index]['sources'])
+            remaining_sources[index] = sorted(segment_sources)
+
+    # Track active pixels as indices of the output, where None evaluates the full block
+    class_values = out_values
+    active = None
+    active_sources = None
+    previous_values = {}
+    previous_candidates = None
+
+    def flat_layer(layer_name):
+        if layer_name not in layer_values:
+            if layer_name in previous_values:
+                # Narrow layers gathered before the last compaction
+                layer_values[layer_name] = previous_values[layer_name][previous_candidates]
+            else:
+                if layer_name not in block_layers:
+                    block_layers[layer_name] = np.ascontiguousarray(blocks[layer_name]).reshape(-1)
+                layer_values[layer_name] = (block_layers[layer_name] if active is None
+                                            else block_layers[layer_name][active])
+        return layer_values[layer_name]
+
+    # Preallocate masks for rules with many source pixels
+    rule_buffer = np.empty(out_values.size, dtype=bool)
+    condition_buffer = np.empty(out_values.size, dtype=bool)
+    term_buffer = np.empty(out_values.size, dtype=bool)
+
+    # Define a function to test a comparison on gathered candidate pixels or into a full mask
+    def test_term(term, candidates, mask):
+        layer_name, compare, operand = term
+        values = flat_layer(layer_name) if candidates is None else flat_layer(layer_name)[candidates]
+        if operand[0] == 'value':
+            return compare(values, operand[1], out=mask)
+        if operand[0] == 'values':
+            result = compare(values, operand[1][0], out=mask)
+            for value in operand[1][1:]:
+                result |= values == value
+            return result
+        other_values = flat_layer(operand[1]) if candidates is None else flat_layer(operand[1])[candidates]
+        if operand[2] is not None:
+            other_values = other_values * operand[2]
+        return compare(values, other_values, out=mask)
+
+    # Define a function to test a condition whose comparisons suffice individually
+    def test_condition(condition, candidates):
+        if candidates is None:
+            test_term(condition[0], None, condition_mask)
+            for term in condition[1:]:
+                np.logical_or(condition_mask, test_term(term, None, term_mask), out=condition_mask)
+            return condition_mask
+        result = test_term(condition[0], candidates, None)
+        for term in condition[1:]:
+            result |= test_term(term, candidates, None)
+        return result
+
+    # Define a function to find pixels of a set of classes in a preallocated mask
+    def match_classes(values, classes):
+        class_mask = np.equal(values, classes[0], out=rule_buffer[:values.size])
+        for class_value in classes[1:]:
+            class_mask |= np.equal(values, class_value, out=term_buffer[:values.size])
+        return class_mask
+
+    # Apply rules in order
+    for index, rule in enumerate(compiled_rules):
+        # Scatter active pixels back before a rule that tests every pixel
+        if remaining_sources[index] is None and active is not None:
+            out_values[active] = class_values
+            class_values, active, active_sources = out_values, None, None
+            layer_values.clear()
+            previous_values = {}
+        # Gather pixels that remaining rules can change when a sample of pixels shows that they are few
+        elif remaining_sources[index] is not None and remaining_sources[index] != active_sources and compact_fraction > 0:
+            active_sources = remaining_sources[index]
+            sample_values = np.ascontiguousarray(class_values[::16])
+            if np.count_nonzero(match_classes(sample_values, active_sources)) < compact_fraction * sample_values.size:
+                candidates = np.flatnonzero(match_classes(class_values, active_sources))
+                if active is not None:
+                    out_values[active] = class_values
+                active = candidates if active is None else active[candidates]
+                class_values = out_values[active]
+                previous_values = dict(layer_values)
+                previous_candidates = candidates
+                layer_values.clear()
+        pixel_count = class_values.size
+        rule_mask = rule_buffer[:pixel_count]
+        condition_mask = condition_buffer[:pixel_count]
+        term_mask = term_buffer[:pixel_count]
+
+        # Find pixels of the source classes
+        if rule['sources'] is None:
+            rule_mask[:] = True
+            source_count = pixel_count
+        else:
+            rule_mask = match_classes(class_values, rule['sources'])
+            source_count = np.count_nonzero(rule_mask)
+            if source_count == 0:
+                continue
+        if source_count < sparse_fraction * pixel_count:
+            # Narrow gathered candidates by each condition
+            candidates = np.flatnonzero(rule_mask)
+            for condition in rule['conditions']:
+                candidates = candidates[test_condition(condition, candidates)]
+                if candidates.size == 0:
+                    break
+            class_values[candidates] = rule['class']
+        else:
+            # Combine full masks of each condition until no candidate pixels remain
+            for condition in rule['conditions']:
+                rule_mask &= test_condition(condition, None)
+                if not rule_mask.any():
+                    break
+            np.copyto(class_values, rule['class'], where=rule_mask)
+
+    # Scatter remaining active pixels back to the output
+    if active is not None:
+        out_values[active] = class_values
+
+    return out_block
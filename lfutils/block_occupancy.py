@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Block occupancy
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Block occupancy" is a function that classifies raster blocks by how much of the processing domain they contain, caching the result between runs.
+# ---------------------------------------------------------------------------
+
+# Define a function to classify raster blocks by domain occupancy
+def block_occupancy(domain_raster, window_list, band=1, domain_value=1):
+    """
+    Description: classifies each window as 'empty', 'full', or 'partial' by whether none, all, or some of its cells equal the domain value, reusing states cached in a json index next to the domain raster until the raster changes
+    Inputs: 'domain_raster' -- an open rasterio dataset of the processing domain
+            'window_list' -- a list of rasterio windows on the grid of the domain raster
+            'band' -- the band of the domain raster that holds the domain
+            'domain_value' -- the value of cells inside the domain
+    Returned Value: Returns a list of block states in the order of the windows
+    Preconditions: outputs of blocks in the 'empty' state must be no data regardless of other inputs
+    """
+
+    # Import packages
+    import json
+    import os
+    import numpy as np
+    from lfutils.file_fingerprint import file_fingerprint
+
+    # Read cached block states if the domain raster is unchanged
+    index_file = domain_raster.name + '.occupancy.json'
+    index_key = f'band{band}_value{domain_value}'
+    fingerprint = file_fingerprint(domain_raster.name)
+    occupancy_index = {'fingerprint': fingerprint, 'states': {}}
+    if os.path.exists(index_file):
+        try:
+            with open(index_file) as file:
+                cached_index = json.load(file)
+            if cached_index.get('fingerprint') == fingerprint:
+                occupancy_index = cached_index
+        except ValueError:
+            pass
+    block_states = occupancy_index['states'].setdefault(index_key, {})
+
+    # Classify windows that are not cached
+    states = []
+    index_changed = False
+    for window in window_list:
+        window_key = f'{int(window.row_off)}_{int(window.col_off)}_{int(window.height)}_{int(window.width)}'
+        if window_key not in block_states:
+            domain_block = domain_raster.read(band, window=window, masked=False)
+            domain_count = np.count_nonzero(domain_block == domain_value)
+            if domain_count == 0:
+                block_states[window_key] = 'empty'
+            elif domain_count == domain_block.size:
+                block_states[window_key] = 'full'
+            else:
+                block_states[window_key] = 'partial'
+            index_changed = True
+        states.append(block_states[window_key])
+
+    # Cache block states through a temporary file so that an interrupted write is not read as complete, skipping read-only folders
+    if index_changed:
+        temporary_file = f'{index_file}.{os.getpid()}.tmp'
+        try:
+            with open(temporary_file, 'w') as file:
+                json.dump(occupancy_index, file)
+            os.replace(temporary_file, index_file)
+        except OSError:
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+
+    return states
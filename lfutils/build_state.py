@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Build state
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Build state" is a function that describes the inputs and parameters that an output is built from.
+# ---------------------------------------------------------------------------
+
+# Define a function to describe the build state of an output
+def build_state(inputs, parameters, method='stat'):
+    """
+    Description: describes the inputs and processing parameters of an output in a form that can be stored as JSON
+    Inputs: 'inputs' -- a path or list of paths to input files, including tile lists and processing scripts
+            'parameters' -- a dictionary of warp, kernel, or other processing parameters
+            'method' -- the fingerprint method passed to file_fingerprint
+    Returned Value: Returns a dictionary of input fingerprints and normalized parameters
+    Preconditions: parameters must be convertible to JSON, with other objects stored as strings
+    """
+
+    # Import packages
+    import json
+    from lfutils.file_fingerprint import file_fingerprint
+
+    # Fingerprint inputs in the order given
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    input_fingerprints = [file_fingerprint(input_file, method) for input_file in inputs]
+
+    # Normalize parameters so that tuples and lists compare equally after storage
+    parameters = json.loads(json.dumps(parameters, sort_keys=True, default=str))
+
+    return {'inputs': input_fingerprints, 'parameters': parameters}
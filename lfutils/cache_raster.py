@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Cache raster
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Cache raster" is a function that stores a compressed raster as an uncompressed, block-aligned array that is read through memory mapping.
+# ---------------------------------------------------------------------------
+
+# Define a function to cache a raster as a memory-mapped array
+def cache_raster(raster_file, cache_folder, cache_name=None):
+    """
+    Description: decompresses a raster once into an uncompressed numpy array file padded to whole blocks of the raster, rebuilding the cache only when the build manifest shows that the source raster has changed
+    Inputs: 'raster_file' -- a path to the source raster
+            'cache_folder' -- a local folder for cached arrays, ideally on a fast disk with space for the uncompressed raster
+            'cache_name' -- an optional file name for the cached array, by default the source file name with a .npy extension
+    Returned Value: Returns the path to the cached array, which read_window reads in place of the source raster
+    Preconditions: the cached array has the bands, grid, and data type of the source raster but no georeferencing, so profiles, windows, and build inputs must still refer to the source raster
+    """
+
+    # Import packages
+    import os
+    import numpy as np
+    import rasterio
+    from lfutils.prepare_build import prepare_build
+    from lfutils.record_build import record_build
+
+    # Define cache file
+    if cache_name is None:
+        cache_name = os.path.splitext(os.path.basename(raster_file))[0] + '.npy'
+    cache_file = os.path.join(cache_folder, cache_name)
+
+    # Return cache if the source raster is unchanged
+    with rasterio.open(raster_file) as source_raster:
+        block_height, block_width = source_raster.block_shapes[0]
+        cache_shape = (source_raster.count,
+                       -(-source_raster.height // block_height) * block_height,
+                       -(-source_raster.width // block_width) * block_width)
+        cache_parameters = {'shape': list(cache_shape), 'dtype': source_raster.dtypes[0]}
+        if prepare_build(cache_file, raster_file, cache_parameters) == False:
+            return cache_file
+
+        # Decompress source blocks into the cached array
+        print(f'Caching {os.path.basename(raster_file)} as an uncompressed array...')
+        os.makedirs(cache_folder, exist_ok=True)
+        temporary_file = cache_file + '.tmp.npy'
+        cache_array = np.lib.format.open_memmap(temporary_file, mode='w+', dtype=source_raster.dtypes[0],
+                                                shape=cache_shape)
+        for block_index, window in source_raster.block_windows(1):
+            row_off, col_off = int(window.row_off), int(window.col_off)
+            cache_array[:, row_off:row_off + int(window.height), col_off:col_off + int(window.width)] = \
+                source_raster.read(window=window, masked=False)
+        cache_array.flush()
+        del cache_array
+    os.replace(temporary_file, cache_file)
+    record_build(cache_file, raster_file, cache_parameters)
+
+    return cache_file
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Collect metrics
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Collect metrics" is a function that summarizes the time, data volume, throughput, and memory of a completed processing job or stage.
+# ---------------------------------------------------------------------------
+
+# Define a function to collect job metrics
+def collect_metrics(stage, output, inputs, start, pixels=None, blocks=None):
+    """
+    Description: summarizes a completed job or stage as a metrics record
+    Inputs: 'stage' -- a name for the job or stage
+            'output' -- a path to the completed output raster
+            'inputs' -- a path or list of paths to input files
+            'start' -- a dictionary of start times returned by start_metrics
+            'pixels' -- an optional output pixel count, read from the output if not provided
+            'blocks' -- an optional number of processed raster blocks
+    Returned Value: Returns a dictionary of wall and CPU seconds, bytes read and written, megapixels per second, block count, and peak resident memory
+    Preconditions: must be called in the process that ran the job; bytes are on-disk file sizes and peak memory is the process peak so far
+    """
+
+    # Import packages
+    import datetime
+    import os
+    import sys
+    import time
+    import rasterio
+
+    # Calculate elapsed times
+    wall_seconds = time.time() - start['wall']
+    cpu_seconds = time.process_time() - start['cpu']
+
+    # Calculate bytes read and written from file sizes
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    bytes_read = sum(os.path.getsize(input_file) for input_file in inputs if os.path.exists(input_file))
+    bytes_written = os.path.getsize(output) if os.path.exists(output) else 0
+
+    # Read output pixel count
+    if pixels is None and os.path.exists(output):
+        with rasterio.open(output) as output_raster:
+            pixels = output_raster.width * output_raster.height
+
+    # Read peak resident memory from resource on Unix or psutil on Windows
+    peak_rss = None
+    try:
+        import resource
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss = peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+    except ImportError:
+        try:
+            import psutil
+            peak_rss = psutil.Process().memory_info().peak_wset
+        except (ImportError, AttributeError):
+            pass
+
+    return {'stage': stage,
+            'output': os.path.abspath(output),
+            'finished': datetime.datetime.now().isoformat(timespec='seconds'),
+            'wall_seconds': round(wall_seconds, 3),
+            'cpu_seconds': round(cpu_seconds, 3),
+            'bytes_read': bytes_read,
+            'bytes_written': bytes_written,
+            'pixels': pixels,
+            'megapixels_per_second': round(pixels / 1000000 / max(wall_seconds, 0.001), 3) if pixels else None,
+            'blocks': blocks,
+            'peak_rss_mb': round(peak_rss / 1024 / 1024, 1) if peak_rss else None}
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Compile rules
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Compile rules" is a function that reads an ordered rule table of class assignments and compiles its conditions for the vectorized rule evaluator.
+# ---------------------------------------------------------------------------
+
+# Define a function to compile an ordered rule table
+def compile_rules(rule_file):
+    """
+    Description: reads an ordered json rule table where each rule assigns a class to pixels whose current class is in a set of source classes and whose named layers meet all conditions, and parses each condition into comparisons
+    Inputs: 'rule_file' -- a path to a json list of rules with 'class', optional 'from' (a list of source classes, or absent to test every pixel), 'when' (a list of conditions that must all be met), an optional 'major' flag that marks the leading major-break rules, and an optional 'note'
+    Returned Value: Returns a list of compiled rules for apply_rules
+    Preconditions: conditions are comparisons 'layer op value' joined by '|' when any of them suffices, where op is one of >=, <=, >, <, ==, != with a number, a layer, or 'layer * factor', or 'in' with a comma-separated list of numbers
+    """
+
+    # Import packages
+    import json
+    import re
+    import numpy as np
+
+    # Define comparison functions that write into preallocated masks
+    comparisons = {'>=': np.greater_equal, '<=': np.less_equal, '>': np.greater, '<': np.less,
+                   '==': np.equal, '!=': np.not_equal, 'in': np.equal}
+    term_pattern = re.compile(r'^\s*(\w+)\s*(>=|<=|==|!=|>|<|\bin\b)\s*(.+?)\s*$')
+    layer_pattern = re.compile(r'^([A-Za-z_]\w*)(?:\s*\*\s*([-+]?[\d.]+))?$')
+
+    # Define a function to parse a number
+    def parse_number(text):
+        value = float(text)
+        return int(value) if value.is_integer() and '.' not in text else value
+
+    # Define a function to parse a comparison into a layer, a comparison function, and an operand
+    def parse_term(term, rule_note):
+        term_match = term_pattern.match(term)
+        if term_match is None:
+            raise ValueError(f'Cannot parse condition "{term}" of rule {rule_note}.')
+        layer_name, operator_text, operand_text = term_match.groups()
+        if operator_text == 'in':
+            source_values = [parse_number(value) for value in operand_text.split(',')]
+            return layer_name, comparisons['in'], ('values', source_values)
+        try:
+            return layer_name, comparisons[operator_text], ('value', parse_number(operand_text))
+        except ValueError:
+            pass
+        layer_match = layer_pattern.match(operand_text)
+        if layer_match is None:
+            raise ValueError(f'Cannot parse operand "{operand_text}" of rule {rule_note}.')
+        factor = None if layer_match.group(2) is None else parse_number(layer_match.group(2))
+        return layer_name, comparisons[operator_text], ('layer', layer_match.group(1), factor)
+
+    # Read rule table
+    with open(rule_file) as file:
+        rule_table = json.load(file)
+
+    # Compile rules in order
+    compiled_rules = []
+    for rule in rule_table:
+        rule_note = rule.get('note', str(rule['class']))
+        source_classes = rule.get('from')
+        compiled_rules.append({
+            'class': int(rule['class']),
+            'sources': None if source_classes is None else [int(source) for source in source_classes],
+            'conditions': [[parse_term(term, rule_note) for term in condition.split('|')]
+                           for condition in rule.get('when', [])],
+            'major': bool(rule.get('major', False)),
+            'note': rule_note})
+
+    return compiled_rules
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Copy job
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Copy job" is a function that runs a warp job on pixel-aligned grids as a streamed windowed copy.
+# ---------------------------------------------------------------------------
+
+# Define a function to run a pixel-aligned warp job
+def copy_job(job, alignment, strip_rows=512):
+    """
+    Description: writes the output of a warp job whose inputs share the output grid by copying the offset window of each input, casting to the output type and replacing input no data with output no data, streaming output row strips so that memory does not depend on raster size
+    Inputs: 'job' -- a job dictionary accepted by warp_job
+            'alignment' -- a dictionary returned by grid_alignment for the job with a factor of 1
+            'strip_rows' -- an integer number of output rows processed at a time
+    Returned Value: Returns the output pixel count
+    Preconditions: later inputs overwrite earlier inputs where they have data, and values outside the range of an integer output type are clamped and rounded, as in gdal.Warp
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+    from lfutils.aligned_profile import aligned_profile
+
+    # Define output profile
+    options = job['options']
+    width = alignment['width']
+    height = alignment['height']
+    output_profile = aligned_profile(job, alignment)
+    output_nodata = output_profile['nodata']
+    fill_value = output_nodata if output_nodata is not None else 0
+    output_type = np.dtype(output_profile['dtype'])
+
+    # Write output row strips
+    with rasterio.open(job['output'], 'w', **output_profile) as dst:
+        for strip_start in range(0, height, strip_rows):
+            strip_end = min(strip_start + strip_rows, height)
+            strip_block = np.full((strip_end - strip_start, width), fill_value, dtype=output_type)
+            for source in alignment['sources']:
+                row_start = max(source['row_offset'], strip_start)
+                row_end = min(source['row_offset'] + source['height'], strip_end)
+                col_start = max(source['col_offset'], 0)
+                col_end = min(source['col_offset'] + source['width'], width)
+                if row_start >= row_end or col_start >= col_end:
+                    continue
+
+                # Read offset window of input
+                read_window = Window(col_start - source['col_offset'], row_start - source['row_offset'],
+                                     col_end - col_start, row_end - row_start)
+                with rasterio.open(source['input']) as input_raster:
+                    input_block = input_raster.read(1, window=read_window)
+                    input_nodata = options.get('srcNodata', input_raster.nodata)
+                valid_block = np.ones(input_block.shape, dtype=bool) if input_nodata is None \
+                    else input_block != input_nodata
+
+                # Cast values to output type
+                if np.issubdtype(output_type, np.integer):
+                    if np.issubdtype(input_block.dtype, np.floating):
+                        input_block = np.floor(input_block + 0.5)
+                    type_range = np.iinfo(output_type)
+                    if np.can_cast(input_block.dtype, output_type) == False:
+                        input_block = np.clip(input_block, type_range.min, type_range.max)
+                input_block = input_block.astype(output_type)
+
+                # Overwrite earlier inputs where the input has data
+                strip_view = strip_block[row_start - strip_start:row_end - strip_start, col_start:col_end]
+                strip_view[valid_block] = input_block[valid_block]
+            dst.write(strip_block, 1, window=Window(0, strip_start, width, strip_end - strip_start))
+
+    return width * height
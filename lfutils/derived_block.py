@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Derived block
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Derived block" is a function that calculates a derived layer for a raster block with the values it would have if written to and read from its storage type.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate a derived layer block
+def derived_block(expression, blocks, area_block, nodata=-32768, lower=None, upper=None, storage='int16'):
+    """
+    Description: evaluates a derived layer expression, sets cells outside the area to no data, and converts the result through its storage type
+    Inputs: 'expression' -- a string expression over input names
+            'blocks' -- a dictionary of input names and int16 blocks
+            'area_block' -- a block of the automated domain where 1 is inside the area
+            'nodata' -- the int16 no data value
+            'lower' -- an optional value that replaces results below it
+            'upper' -- an optional value that replaces results above it
+            'storage' -- the storage type of the layer, either 'int16' or 'uint8'
+    Returned Value: Returns an int16 block equal to a read with read_cover of the layer written with store_cover
+    Preconditions: input blocks must be read with read_cover
+    """
+
+    # Import packages
+    import numpy as np
+    from lfutils.evaluate_expression import evaluate_expression
+    from lfutils.store_cover import store_cover
+
+    # Calculate derived layer
+    raster_block = evaluate_expression(expression, blocks, nodata, lower, upper)
+
+    # Set no data values from area raster to no data
+    raster_block = np.where(area_block != 1, nodata, raster_block)
+
+    # Convert through storage type, truncating decimals as a raster write does
+    stored_block = store_cover(raster_block, storage)
+    if storage == 'uint8':
+        raster_block = stored_block.astype(np.int16)
+        raster_block[stored_block == 255] = nodata
+    else:
+        raster_block = stored_block.astype(np.int16)
+
+    return raster_block
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Derived layers
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Derived layers" is a function that declares the derived layers of the programmatic key as expressions over named foliar cover and domain inputs.
+# ---------------------------------------------------------------------------
+
+# Define a function to declare derived layers
+def derived_layers(derived_folder, cover_storage='int16'):
+    """
+    Description: declares the derived layers shared by the script that materializes them and the key that calculates them per block when they have no file
+    Inputs: 'derived_folder' -- the folder of materialized derived layers
+            'cover_storage' -- the storage type of cover layers, either 'int16' or 'uint8'
+    Returned Value: Returns a list of tuples of layer name, description, output file, expression, lower limit, upper limit, and storage type
+    Preconditions: expression names must match the band names of the feature cube
+    """
+
+    # Import packages
+    import os
+
+    # Define derived layers as expressions over named inputs
+    layer_list = [
+        ('picratio', 'Picea ratio', os.path.join(derived_folder, 'picea_ratio_30m_3338.tif'),
+         'picgla / (picgla + picmar + 0.01) * 100', None, None, cover_storage),
+        ('picsum', 'Picea sum', os.path.join(derived_folder, 'picea_sum_30m_3338.tif'),
+         'picgla + picmar', None, None, cover_storage),
+        ('decratio', 'deciduous ratio', os.path.join(derived_folder, 'deciduous_ratio_30m_3338.tif'),
+         'dectre / (picgla + picmar + dectre + 0.01) * 100', None, None, cover_storage),
+        ('ndshrub', 'non-dwarf shrub sum', os.path.join(derived_folder, 'alder_birch_willow_30m_3338.tif'),
+         'alnus + salshr + betshr', None, None, 'int16'),
+        ('eridwarf', 'ericaceous dwarf shrub sum', os.path.join(derived_folder, 'ericaceous_dwarf_30m_3338.tif'),
+         'empnig + rhoshr + vacvit', None, None, 'int16'),
+        ('wetland', 'wetland indicator', os.path.join(derived_folder, 'wetland_indicator_30m_3338.tif'),
+         'sphagn + wetsed', None, None, cover_storage),
+        ('picwet', 'Picea mariana wet indicator', os.path.join(derived_folder, 'picmar_wet_indicator_30m_3338.tif'),
+         'erivag + sphagn + wetsed', None, None, 'int16'),
+        ('herbac', 'herbaceous output', os.path.join(derived_folder, 'herbaceous_30m_3338.tif'),
+         '(where(above != 1, 0, forb) + where(above != 1, 0, gramin)) - (erivag + wetsed)', 0, None, cover_storage),
+        ('vegetation', 'vegetation sum', os.path.join(derived_folder, 'vegetation_30m_3338.tif'),
+         'dectre + where(above != 1, 0, decshr) + where(above != 1, 0, evrshr) + where(above != 1, 0, forb)'
+         ' + where(above != 1, 0, gramin) + picgla + picmar + sphagn', None, 254, cover_storage)
+    ]
+
+    return layer_list
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Evaluate expression
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation. Uses numexpr when it is installed.
+# Description: "Evaluate expression" is a function that evaluates a raster expression over named blocks with a fused, multithreaded engine.
+# ---------------------------------------------------------------------------
+
+# Define a function to evaluate a raster expression
+def evaluate_expression(expression, blocks, nodata=-32768, lower=None, upper=None):
+    """
+    Description: evaluates an expression over named input blocks in cache-sized chunks on all cores with numexpr, without a temporary array per operator, and clamps the result; cells with a no data input are evaluated with numpy so that int16 overflow matches the numpy calculation
+    Inputs: 'expression' -- a string expression over input names, using arithmetic, comparison, and where(condition, a, b)
+            'blocks' -- a dictionary of input names and numpy arrays of the same shape
+            'nodata' -- the no data value of the input blocks
+            'lower' -- an optional value that replaces results below it
+            'upper' -- an optional value that replaces results above it
+    Returned Value: Returns a numpy array of the expression results
+    Preconditions: without numexpr the expression is evaluated with numpy and the same results
+    """
+
+    # Import packages
+    import numpy as np
+    from lfutils.expression_names import expression_names
+
+    # Select input blocks of the expression
+    input_names = expression_names(expression)
+    input_blocks = {input_name: blocks[input_name] for input_name in input_names}
+    numpy_functions = {'__builtins__': {}, 'where': np.where}
+
+    # Evaluate expression
+    try:
+        import numexpr
+    except ImportError:
+        numexpr = None
+    if numexpr is None:
+        result_block = eval(expression, numpy_functions, input_blocks)
+    else:
+        result_block = numexpr.evaluate(expression, local_dict=input_blocks)
+        # Evaluate cells with no data inputs with numpy to reproduce int16 overflow
+        nodata_mask = np.zeros(result_block.shape, dtype=bool)
+        for input_block in input_blocks.values():
+            nodata_mask |= input_block == nodata
+        if nodata_mask.any():
+            nodata_blocks = {input_name: input_block[nodata_mask] for input_name, input_block in input_blocks.items()}
+            result_block[nodata_mask] = eval(expression, numpy_functions, nodata_blocks)
+
+    # Clamp results
+    if lower is not None:
+        result_block = np.where(result_block < lower, lower, result_block)
+    if upper is not None:
+        result_block = np.where(result_block > upper, upper, result_block)
+
+    return result_block
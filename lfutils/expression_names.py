@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Expression names
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Expression names" is a function that lists the named inputs of a raster expression.
+# ---------------------------------------------------------------------------
+
+# Define a function to list the inputs of an expression
+def expression_names(expression):
+    """
+    Description: parses a raster expression and lists the input names it uses in order of first use, excluding function names
+    Inputs: 'expression' -- a string expression such as 'picgla / (picgla + picmar + 0.01) * 100'
+    Returned Value: Returns a list of input names
+    Preconditions: the expression must be valid Python syntax
+    """
+
+    # Import packages
+    import ast
+
+    # Collect names that are not called as functions
+    parsed = ast.parse(expression, mode='eval')
+    function_names = {node.func.id for node in ast.walk(parsed)
+                      if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)}
+    input_names = []
+    for node in sorted((node for node in ast.walk(parsed) if isinstance(node, ast.Name)),
+                       key=lambda node: node.col_offset):
+        if node.id not in function_names and node.id not in input_names:
+            input_names.append(node.id)
+
+    return input_names
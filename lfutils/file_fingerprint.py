@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# File fingerprint
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "File fingerprint" is a function that summarizes the state of a file by its size and modification time or by a content hash.
+# ---------------------------------------------------------------------------
+
+# Define a function to fingerprint a file
+def file_fingerprint(file_path, method='stat'):
+    """
+    Description: creates a fingerprint of a file from its size and modification time or from a hash of its contents
+    Inputs: 'file_path' -- a path to a file
+            'method' -- 'stat' to use size and modification time or 'hash' to use a SHA-256 hash of the contents
+    Returned Value: Returns a dictionary describing the file, with 'exists' set to False for missing files
+    Preconditions: the hash method reads the whole file and is intended for small or critical inputs
+    """
+
+    # Import packages
+    import hashlib
+    import os
+
+    # Return a placeholder for missing files
+    fingerprint = {'path': os.path.abspath(file_path)}
+    if os.path.exists(file_path) == 0:
+        fingerprint['exists'] = False
+        return fingerprint
+
+    # Describe file state
+    file_stat = os.stat(file_path)
+    fingerprint['exists'] = True
+    fingerprint['size'] = file_stat.st_size
+    if method == 'hash':
+        file_hash = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(16 * 1024 * 1024), b''):
+                file_hash.update(chunk)
+        fingerprint['sha256'] = file_hash.hexdigest()
+    else:
+        fingerprint['mtime'] = file_stat.st_mtime_ns
+
+    return fingerprint
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Grid alignment
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Grid alignment" is a function that tests whether the inputs of a warp job lie on the output grid or on an integer subdivision of it.
+# ---------------------------------------------------------------------------
+
+# Define a function to test the grid alignment of a warp job
+def grid_alignment(job, tolerance=0.000001):
+    """
+    Description: tests whether every input of a warp job is a north-up raster whose cell size divides the output cell size by a common integer factor and whose origin falls on a cell corner of the input grid extended from the output origin
+    Inputs: 'job' -- a job dictionary accepted by warp_job
+            'tolerance' -- a float tolerance as a fraction of a cell
+    Returned Value: Returns None if the job needs a general warp, otherwise a dictionary with the output 'width', 'height', and 'transform', the integer 'factor', and a list of 'sources' as dictionaries of 'input', 'col_offset', 'row_offset', 'width', 'height', and 'dtype', where offsets are in input cells from the output origin
+    Preconditions: the job must define outputBounds, xRes, and yRes in the same coordinate system as the inputs
+    """
+
+    # Import packages
+    import rasterio
+    from rasterio.transform import from_origin
+
+    # Require an unreprojected GeoTIFF output on explicit bounds
+    options = job['options']
+    if options.get('format', 'GTiff') != 'GTiff' or options.get('targetAlignedPixels', False):
+        return None
+    if options.get('srcSRS') != options.get('dstSRS') or options.get('cutlineDSName') is not None:
+        return None
+    if 'outputBounds' not in options or 'xRes' not in options or 'yRes' not in options:
+        return None
+    xmin, ymin, xmax, ymax = options['outputBounds']
+    x_res = abs(options['xRes'])
+    y_res = abs(options['yRes'])
+
+    # Define a function to convert a ratio to an integer when it is one within tolerance
+    def whole_number(value):
+        rounded = round(value)
+        return rounded if abs(value - rounded) <= tolerance else None
+
+    # Test each input grid
+    inputs = job['inputs']
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    factor = None
+    sources = []
+    for raster_input in inputs:
+        with rasterio.open(raster_input) as input_raster:
+            transform = input_raster.transform
+            if input_raster.count != 1 or transform.b != 0 or transform.d != 0 or transform.e >= 0:
+                return None
+            input_factor = whole_number(x_res / transform.a)
+            if input_factor is None or input_factor < 1 or whole_number(y_res / -transform.e) != input_factor:
+                return None
+            if factor is not None and input_factor != factor:
+                return None
+            factor = input_factor
+            col_offset = whole_number((transform.c - xmin) / transform.a)
+            row_offset = whole_number((ymax - transform.f) / -transform.e)
+            if col_offset is None or row_offset is None:
+                return None
+            sources.append({'input': raster_input,
+                            'col_offset': col_offset,
+                            'row_offset': row_offset,
+                            'width': input_raster.width,
+                            'height': input_raster.height,
+                            'dtype': input_raster.dtypes[0]})
+
+    # Calculate output grid with the rounding used by gdal.Warp
+    return {'width': int((xmax - xmin) / x_res + 0.5),
+            'height': int((ymax - ymin) / y_res + 0.5),
+            'transform': from_origin(xmin, ymax, x_res, y_res),
+            'factor': factor,
+            'sources': sources}
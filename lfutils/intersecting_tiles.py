@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Intersecting tiles
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Intersecting tiles" is a function that selects the raster tiles of a footprint index whose footprints intersect a set of bounds.
+# ---------------------------------------------------------------------------
+
+# Define a function to select tiles that intersect bounds
+def intersecting_tiles(footprints, bounds):
+    """
+    Description: queries a footprint index for tiles that intersect the requested bounds without reading or validating the tile folder again
+    Inputs: 'footprints' -- a dictionary of tile paths and bounds as [xmin, ymin, xmax, ymax] returned by tile_footprints once per run
+            'bounds' -- a sequence of [xmin, ymin, xmax, ymax] such as the output bounds of a warp or window
+    Returned Value: Returns a sorted list of paths to the intersecting tiles
+    Preconditions: tiles must share a coordinate system with the bounds
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Convert footprint index to arrays
+    if len(footprints) == 0:
+        return []
+    tile_paths = list(footprints.keys())
+    tile_bounds = np.array(list(footprints.values()), dtype=np.float64)
+
+    # Select tiles whose footprints overlap the bounds
+    xmin, ymin, xmax, ymax = bounds
+    overlap = ((tile_bounds[:, 0] < xmax) & (tile_bounds[:, 2] > xmin)
+               & (tile_bounds[:, 1] < ymax) & (tile_bounds[:, 3] > ymin))
+
+    return [tile_paths[index] for index in np.flatnonzero(overlap)]
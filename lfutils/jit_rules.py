@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# JIT rules
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation. Requires numba for the compiled engine.
+# Description: "JIT rules" is a function that compiles an ordered rule table into a single per-pixel function with early exit.
+# ---------------------------------------------------------------------------
+
+# Define a function to compile rules into a per-pixel function
+def jit_rules(compiled_rules, parallel=True, kernel_folder=None):
+    """
+    Description: generates one per-pixel function from the rules returned by compile_rules, in which each pixel tests only the rules whose source classes contain its current class, evaluates conditions with short-circuit logic, and exits once no later rule can change its class; the function is compiled with numba to loop over rows in parallel or to release the GIL for block threads
+    Inputs: 'compiled_rules' -- a list of rules returned by compile_rules
+            'parallel' -- True to run rows of a block on all cores, or False to run each block on one core, such as when blocks are processed by worker threads
+            'kernel_folder' -- an optional folder for the generated source and the numba cache, by default in the temporary folder
+    Returned Value: Returns a function of an output block and a dictionary of layer blocks with the signature of apply_rules, or None when numba is not installed
+    Preconditions: results equal apply_rules except for integer factors in layer comparisons, which are evaluated without int16 overflow
+    """
+
+    # Import packages
+    import hashlib
+    import importlib
+    import os
+    import sys
+    import tempfile
+    import numpy as np
+    from lfutils.rule_layers import rule_layers
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # List layers referenced by rules
+    layer_names = []
+    for rule in compiled_rules:
+        for condition in rule['conditions']:
+            for layer_name, compare, operand in condition:
+                for name in [layer_name] + ([operand[1]] if operand[0] == 'layer' else []):
+                    if name not in layer_names:
+                        layer_names.append(name)
+    layer_arguments = {layer_name: f'layer_{index}' for index, layer_name in enumerate(layer_names)}
+
+    # Define comparison operators of the generated source
+    operator_text = {np.greater_equal: '>=', np.less_equal: '<=', np.greater: '>', np.less: '<',
+                     np.equal: '==', np.not_equal: '!='}
+
+    # Define a function to generate the source of a comparison
+    def term_source(term):
+        layer_name, compare, operand = term
+        value_text = f'{layer_arguments[layer_name]}[row, column]'
+        if operand[0] == 'value':
+            return f'{value_text} {operator_text[compare]} {operand[1]!r}'
+        if operand[0] == 'values':
+            return '(' + ' or '.join(f'{value_text} == {value!r}' for value in operand[1]) + ')'
+        other_text = f'{layer_arguments[operand[1]]}[row, column]'
+        if operand[2] is not None:
+            other_text = f'({other_text} * {operand[2]!r})'
+        return f'{value_text} {operator_text[compare]} {other_text}'
+
+    # Generate rule statements with early exit for classes that no later rule can change
+    statements = []
+    exit_classes = None
+    for index, rule in enumerate(compiled_rules):
+        tests = []
+        if rule['sources'] is not None:
+            tests.append('(' + ' or '.join(f'value == {source}' for source in rule['sources']) + ')')
+        for condition in rule['conditions']:
+            tests.append('(' + ' or '.join(term_source(term) for term in condition) + ')')
+        statements.append(f'            # {rule["note"]}')
+        if len(tests) > 0:
+            statements.append(f'            if {" and ".join(tests)}:')
+            statements.append(f'                value = {rule["class"]}')
+        else:
+            statements.append(f'            value = {rule["class"]}')
+        later_rules = compiled_rules[index + 1:]
+        if len(later_rules) > 0 and all(later_rule['sources'] is not None for later_rule in later_rules):
+            live_classes = sorted(set(source for later_rule in later_rules for source in later_rule['sources']))
+            if live_classes == exit_classes:
+                continue
+            exit_classes = live_classes
+            statements.append(f'            if not ({" or ".join(f"value == {source}" for source in live_classes)}):')
+            statements.append('                out_values[row, column] = value')
+            statements.append('                continue')
+    function_source = '\n'.join([
+        'import numba',
+        '',
+        '',
+        f'@numba.njit(parallel={parallel}, nogil=True, cache=True)',
+        f'def rule_kernel(out_values, {", ".join(layer_arguments.values())}):',
+        '    for row in numba.prange(out_values.shape[0]):',
+        '        for column in range(out_values.shape[1]):',
+        '            value = out_values[row, column]'] + statements + [
+        '            out_values[row, column] = value', ''])
+
+    # Write generated source to a module file so that numba caches the compiled function between runs, through a temporary file unique to the process so that parallel runs do not collide
+    if kernel_folder is None:
+        kernel_folder = os.path.join(tempfile.gettempdir(), 'lfutils_kernels')
+    kernel_name = 'rule_kernel_' + hashlib.sha256(function_source.encode()).hexdigest()[:16]
+    kernel_file = os.path.join(kernel_folder, kernel_name + '.py')
+    if os.path.exists(kernel_file) == 0:
+        os.makedirs(kernel_folder, exist_ok=True)
+        temporary_file = f'{kernel_file}.{os.getpid()}.tmp'
+        with open(temporary_file, 'w') as file:
+            file.write(function_source)
+        os.replace(temporary_file, kernel_file)
+
+    # Import compiled per-pixel function by module name so that cached functions can be reloaded
+    if kernel_folder not in sys.path:
+        sys.path.append(kernel_folder)
+    rule_kernel = importlib.import_module(kernel_name).rule_kernel
+
+    # Define a function with the signature of apply_rules
+    def apply_kernel(compiled_rules, out_block, blocks):
+        if not out_block.flags['C_CONTIGUOUS']:
+            raise ValueError('Output block must be contiguous to be updated in place.')
+        out_values = out_block.reshape(-1, out_block.shape[-1])
+        # Pass a placeholder for layers omitted from the dictionary when no rule that can fire tests them
+        missing_layers = [layer_name for layer_name in layer_names if layer_name not in blocks]
+        if len(missing_layers) > 0:
+            needed_layers = rule_layers(compiled_rules, out_block)
+            for layer_name in missing_layers:
+                if layer_name in needed_layers:
+                    raise KeyError(layer_name)
+            placeholder = np.zeros_like(out_values)
+        layer_blocks = [np.ascontiguousarray(blocks[layer_name]).reshape(out_values.shape)
+                        if layer_name in blocks else placeholder for layer_name in layer_names]
+        rule_kernel(out_values, *layer_blocks)
+        return out_block
+
+    return apply_kernel
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Mosaic tiles
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Mosaic tiles" is a function that assembles the tile outputs of split warp jobs into a single raster.
+# ---------------------------------------------------------------------------
+
+# Define a function to assemble tile outputs
+def mosaic_tiles(tile_outputs, mosaic_output, bounds, nodata, creation_options=None):
+    """
+    Description: assembles tile rasters on a common grid into a virtual mosaic that references the tiles or, for a .tif output, copies them into a single tiled GeoTIFF
+    Inputs: 'tile_outputs' -- a list of paths to tile rasters
+            'mosaic_output' -- a path to the output with a .vrt or .tif extension
+            'bounds' -- a list of [xmin, ymin, xmax, ymax] for the full output grid
+            'nodata' -- the no data value of areas without tiles
+            'creation_options' -- a list of GeoTIFF creation options for .tif outputs
+    Returned Value: None
+    Preconditions: tiles must be complete; virtual mosaics remain valid only while the tiles exist
+    """
+
+    # Import packages
+    import os
+    from osgeo import gdal
+
+    # Raise GDAL errors as exceptions so that failures do not leave partial outputs
+    gdal.UseExceptions()
+
+    # Build virtual mosaic on the full output grid
+    if creation_options is None:
+        creation_options = ['COMPRESS=LZW', 'TILED=YES', 'BIGTIFF=YES']
+    virtual_output = os.path.splitext(mosaic_output)[0] + '.vrt'
+    if mosaic_output.endswith('.tif'):
+        virtual_output = os.path.splitext(mosaic_output)[0] + '_tiles.tmp.vrt'
+    gdal.BuildVRT(virtual_output, tile_outputs, outputBounds=bounds, VRTNodata=nodata)
+
+    # Copy virtual mosaic to a single tiled GeoTIFF
+    if mosaic_output.endswith('.tif'):
+        try:
+            gdal.Translate(mosaic_output, virtual_output, format='GTiff', creationOptions=creation_options)
+        except Exception:
+            if os.path.exists(mosaic_output):
+                os.remove(mosaic_output)
+            raise
+        finally:
+            os.remove(virtual_output)
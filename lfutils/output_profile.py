@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Output profile
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Output profile" is a function that copies the profile of an input raster for a tiled, compressed GeoTIFF output.
+# ---------------------------------------------------------------------------
+
+# Define a function to create a GeoTIFF output profile from an input raster
+def output_profile(input_raster, block_size=256, **profile_updates):
+    """
+    Description: copies the grid, data type, and no data value of an input raster into a GeoTIFF profile, replacing the driver and the block layout of virtual rasters such as standardized warped VRTs and area of interest windows, which cannot be written
+    Inputs: 'input_raster' -- an open rasterio dataset
+            'block_size' -- the tile width and height for inputs that are not tiled GeoTIFFs
+            'profile_updates' -- profile keys to update, such as nodata or dtype
+    Returned Value: Returns a rasterio profile dictionary
+    Preconditions: tiled GeoTIFF inputs keep their tile size so that outputs share their block windows
+    """
+
+    # Copy input profile
+    profile = input_raster.profile.copy()
+
+    # Replace the block layout of virtual and untiled inputs
+    if profile.get('driver') != 'GTiff' or profile.get('tiled') != True:
+        profile.update(tiled=True, blockxsize=block_size, blockysize=block_size)
+
+    # Write GeoTIFF with compression
+    profile.update(driver='GTiff', compress='lzw')
+    profile.update(profile_updates)
+
+    return profile
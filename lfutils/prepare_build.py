@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Prepare build
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Prepare build" is a function that determines whether an output must be rebuilt and removes it if so.
+# ---------------------------------------------------------------------------
+
+# Define a function to prepare an output for building
+def prepare_build(output, inputs, parameters, method='stat'):
+    """
+    Description: compares the build manifest of an output to the current inputs and parameters and removes outputs that are stale or incomplete
+    Inputs: 'output' -- a path to an output file
+            'inputs' -- a path or list of paths to input files
+            'parameters' -- a dictionary of processing parameters
+            'method' -- the fingerprint method passed to file_fingerprint
+    Returned Value: Returns True if the output must be built and False if it is current
+    Preconditions: completed outputs must be registered with record_build; outputs without a manifest are treated as incomplete
+    """
+
+    # Import packages
+    import json
+    import os
+    from lfutils.build_state import build_state
+
+    # Compare stored and current build state
+    manifest_file = output + '.build.json'
+    if os.path.exists(output) == 1 and os.path.exists(manifest_file) == 1:
+        try:
+            with open(manifest_file, 'r') as file:
+                stored_state = json.load(file)
+        except ValueError:
+            stored_state = None
+        if stored_state == build_state(inputs, parameters, method):
+            return False
+
+    # Remove stale or incomplete output
+    for file_path in [output, manifest_file]:
+        if os.path.exists(file_path) == 1:
+            os.remove(file_path)
+
+    return True
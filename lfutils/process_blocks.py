@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Process blocks
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Process blocks" is a function that runs a block calculation over raster windows on a thread pool and writes the results in window order.
+# ---------------------------------------------------------------------------
+
+# Define a function to process raster blocks on a thread pool
+def process_blocks(block_function, input_files, window_list, dst, worker_count, block_states=None, nodata=-32768,
+                   progress_interval=100):
+    """
+    Description: reads and calculates raster blocks concurrently in worker threads that each open their own dataset handles, while the calling thread writes finished blocks to the output in window order
+    Inputs: 'block_function' -- a function of a dictionary of open input rasters and a window that returns the output block as a 2D array or an array of shape (band count, height, width)
+            'input_files' -- a dictionary of input names and raster paths passed to the block function as open rasters, where arrays created by cache_raster are opened as read-only memory maps
+            'window_list' -- a list of rasterio windows to process
+            'dst' -- an open rasterio output dataset
+            'worker_count' -- an integer number of worker threads, where 1 processes blocks serially in the calling thread
+            'block_states' -- an optional list of states returned by block_occupancy, where empty blocks are written as no data without calling the block function
+            'nodata' -- the output no data value for empty blocks
+            'progress_interval' -- the progress reporting interval passed to raster_block_progress
+    Returned Value: None
+    Preconditions: the block function must not modify shared state; GDAL reads and numpy calculations release the GIL so threads run concurrently
+    """
+
+    # Import packages
+    import collections
+    import threading
+    import numpy as np
+    import rasterio
+    from concurrent.futures import ThreadPoolExecutor
+    from akutils import raster_block_progress
+
+    # Define a function to open input rasters once per thread
+    thread_data = threading.local()
+    opened_rasters = []
+    opened_lock = threading.Lock()
+
+    def thread_rasters():
+        if not hasattr(thread_data, 'rasters'):
+            thread_data.rasters = {input_name: np.load(input_file, mmap_mode='r') if input_file.endswith('.npy')
+                                   else rasterio.open(input_file)
+                                   for input_name, input_file in input_files.items()}
+            with opened_lock:
+                opened_rasters.extend(input_raster for input_raster in thread_data.rasters.values()
+                                      if not isinstance(input_raster, np.ndarray))
+        return thread_data.rasters
+
+    # Define a function to calculate a block or a no data block for empty windows
+    def calculate_block(window, block_state):
+        if block_state == 'empty':
+            return np.full((dst.count, window.height, window.width), nodata, dtype=dst.dtypes[0])
+        return block_function(thread_rasters(), window)
+
+    # Define a function to write a finished block
+    def write_block(window, out_block):
+        if out_block.ndim == 2:
+            dst.write(out_block, 1, window=window)
+        else:
+            dst.write(out_block, window=window)
+
+    # Iterate processing through raster blocks
+    if block_states is None:
+        block_states = [None] * len(window_list)
+    count = 1
+    progress = 0
+    try:
+        if worker_count <= 1:
+            for window, block_state in zip(window_list, block_states):
+                write_block(window, calculate_block(window, block_state))
+                count, progress = raster_block_progress(progress_interval, len(window_list), count, progress)
+        else:
+            # Keep a bounded number of blocks in flight and write them in submission order
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                pending = collections.deque()
+                for window, block_state in zip(window_list, block_states):
+                    pending.append((window, executor.submit(calculate_block, window, block_state)))
+                    if len(pending) >= 2 * worker_count:
+                        finished_window, future = pending.popleft()
+                        write_block(finished_window, future.result())
+                        count, progress = raster_block_progress(progress_interval, len(window_list), count, progress)
+                while len(pending) > 0:
+                    finished_window, future = pending.popleft()
+                    write_block(finished_window, future.result())
+                    count, progress = raster_block_progress(progress_interval, len(window_list), count, progress)
+    finally:
+        for input_raster in opened_rasters:
+            input_raster.close()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Publish cloud optimized GeoTIFF
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation with GDAL 3.1 or later.
+# Description: "Publish cloud optimized GeoTIFF" is a function that writes a copy of a finished raster as a cloud optimized GeoTIFF with embedded overviews.
+# ---------------------------------------------------------------------------
+
+# Define a function to publish a raster as a cloud optimized GeoTIFF
+def publish_cog(raster_input, cog_output, compression='DEFLATE', predictor='YES', block_size=512, resampling='MODE'):
+    """
+    Description: converts a finished raster to a cloud optimized GeoTIFF with internal tiling and embedded overviews at a separate output path, leaving the finished raster and its build manifest unchanged
+    Inputs: 'raster_input' -- a path to a finished GeoTIFF
+            'cog_output' -- a path to the published cloud optimized GeoTIFF, which must differ from the input
+            'compression' -- a COG driver compression method, such as 'DEFLATE', 'LZW', or 'ZSTD'
+            'predictor' -- a COG driver predictor setting, where 'YES' selects horizontal differencing for integer data
+            'block_size' -- an integer tile size in pixels
+            'resampling' -- the overview resampling method, where 'MODE' preserves categorical values
+    Returned Value: None
+    Preconditions: the raster must be complete and closed; callers register the output with record_build so that it is rebuilt when the input changes
+    """
+
+    # Import packages
+    import os
+    from osgeo import gdal
+
+    # Raise GDAL errors as exceptions so that a failed conversion leaves no partial output
+    gdal.UseExceptions()
+    if os.path.abspath(raster_input) == os.path.abspath(cog_output):
+        raise ValueError('Cloud optimized GeoTIFF must be published to a separate path from its input.')
+
+    # Write cloud optimized copy through a temporary file
+    os.makedirs(os.path.dirname(os.path.abspath(cog_output)), exist_ok=True)
+    temporary_file = os.path.splitext(cog_output)[0] + '_cog.tmp.tif'
+    try:
+        gdal.Translate(temporary_file,
+                       raster_input,
+                       format='COG',
+                       creationOptions=[f'COMPRESS={compression}',
+                                        f'PREDICTOR={predictor}',
+                                        f'BLOCKSIZE={block_size}',
+                                        f'OVERVIEW_RESAMPLING={resampling}',
+                                        'OVERVIEWS=IGNORE_EXISTING',
+                                        'BIGTIFF=IF_SAFER',
+                                        'NUM_THREADS=ALL_CPUS'],
+                       callback=gdal.TermProgress_nocb)
+    except Exception:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+        raise
+
+    # Move completed copy into place
+    os.replace(temporary_file, cog_output)
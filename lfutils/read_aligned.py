@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read aligned
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Read aligned" is a function that reads the window of a raster that matches a window on the grid of a reference raster with a different extent.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a window on the grid of a reference raster
+def read_aligned(raster, window, reference, fill_value=None):
+    """
+    Description: translates a window on the reference grid to the matching window of a raster on the same grid with any extent and reads it, filling cells outside the raster extent
+    Inputs: 'raster' -- an open rasterio dataset to read
+            'window' -- a rasterio window on the grid of the reference raster
+            'reference' -- an open rasterio dataset that defines the grid of the window
+            'fill_value' -- the value of cells outside the raster extent, by default the raster no data value
+    Returned Value: Returns an array of shape (band count, window height, window width) as returned by a read of the reference grid
+    Preconditions: the raster must share the cell size of the reference raster and have an origin on its cell corners
+    """
+
+    # Import packages
+    import numpy as np
+    from rasterio.windows import Window
+
+    # Calculate offset of raster grid from reference grid
+    raster_transform = raster.transform
+    reference_transform = reference.transform
+    col_offset = (reference_transform.c - raster_transform.c) / raster_transform.a
+    row_offset = (reference_transform.f - raster_transform.f) / raster_transform.e
+    if raster_transform.a != reference_transform.a or raster_transform.e != reference_transform.e \
+            or abs(col_offset - round(col_offset)) > 0.000001 or abs(row_offset - round(row_offset)) > 0.000001:
+        raise ValueError(f'{raster.name} is not aligned with the grid of {reference.name}.')
+
+    # Translate window to raster grid
+    col_start = int(window.col_off) + round(col_offset)
+    row_start = int(window.row_off) + round(row_offset)
+    col_end = col_start + int(window.width)
+    row_end = row_start + int(window.height)
+
+    # Read window directly when it lies inside the raster
+    if col_start >= 0 and row_start >= 0 and col_end <= raster.width and row_end <= raster.height:
+        return raster.read(window=Window(col_start, row_start, int(window.width), int(window.height)),
+                           masked=False)
+
+    # Fill cells outside the raster extent
+    if fill_value is None:
+        fill_value = raster.nodata if raster.nodata is not None else 0
+    raster_block = np.full((raster.count, int(window.height), int(window.width)), fill_value,
+                           dtype=raster.dtypes[0])
+    read_cols = (max(col_start, 0), min(col_end, raster.width))
+    read_rows = (max(row_start, 0), min(row_end, raster.height))
+    if read_cols[0] < read_cols[1] and read_rows[0] < read_rows[1]:
+        raster_block[:, read_rows[0] - row_start:read_rows[1] - row_start,
+                     read_cols[0] - col_start:read_cols[1] - col_start] = \
+            raster.read(window=Window(read_cols[0], read_rows[0],
+                                      read_cols[1] - read_cols[0], read_rows[1] - read_rows[0]),
+                        masked=False)
+
+    return raster_block
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read area of interest
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Read area of interest" is a function that reads the optional area of interest that restricts a run to a bounding box or polygon.
+# ---------------------------------------------------------------------------
+
+# Define a function to read the area of interest
+def read_aoi(aoi_file=None):
+    """
+    Description: reads an area of interest definition with a name and either bounds or a polygon file
+    Inputs: 'aoi_file' -- an optional path to a json file, by default aoi.json in the repository root
+    Returned Value: Returns None for a full run or a dictionary with 'name', 'bounds' as [xmin, ymin, xmax, ymax] in EPSG:3338, and 'geometry' as polygon well-known text or None
+    Preconditions: polygon files must be readable by OGR and projected in EPSG:3338
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Return None for a full run
+    if aoi_file is None:
+        aoi_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'aoi.json')
+    if os.path.exists(aoi_file) == 0:
+        return None
+
+    # Read definition
+    with open(aoi_file) as file:
+        aoi_definition = json.load(file)
+    if 'name' not in aoi_definition or ('bounds' in aoi_definition) == ('polygon' in aoi_definition):
+        raise ValueError(f'{aoi_file} must define a name and either bounds or a polygon.')
+
+    # Read bounds and geometry of polygon
+    aoi_geometry = None
+    if 'polygon' in aoi_definition:
+        from osgeo import ogr
+        polygon_source = ogr.Open(aoi_definition['polygon'])
+        polygon_layer = polygon_source.GetLayer()
+        union_geometry = ogr.Geometry(ogr.wkbMultiPolygon)
+        for feature in polygon_layer:
+            union_geometry = union_geometry.Union(feature.GetGeometryRef())
+        xmin, xmax, ymin, ymax = union_geometry.GetEnvelope()
+        aoi_bounds = [xmin, ymin, xmax, ymax]
+        aoi_geometry = union_geometry.ExportToWkt()
+        polygon_source = None
+    else:
+        aoi_bounds = [float(value) for value in aoi_definition['bounds']]
+
+    print(f'Restricting run to area of interest {aoi_definition["name"]}: {aoi_bounds}')
+    return {'name': aoi_definition['name'], 'bounds': aoi_bounds, 'geometry': aoi_geometry}
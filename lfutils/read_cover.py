@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read cover
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Read cover" is a function that reads a window of a cover raster stored as int16 or uint8 as an int16 block.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a cover raster window
+def read_cover(raster, window, nodata=-32768):
+    """
+    Description: reads a window of a cover raster, upcasting uint8 storage to int16 and converting its no data value (255) to the int16 no data value
+    Inputs: 'raster' -- an open rasterio dataset
+            'window' -- a rasterio window
+            'nodata' -- the int16 no data value used by calculations
+    Returned Value: Returns an int16 array with the same shape and values as a read of int16 storage
+    Preconditions: uint8 cover rasters must use 255 as no data; other data types are returned as read
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Read block
+    raster_block = raster.read(window=window, masked=False)
+
+    # Upcast uint8 storage so that sums and thresholds match int16 storage
+    if raster_block.dtype == np.uint8:
+        nodata_mask = raster_block == 255
+        raster_block = raster_block.astype(np.int16)
+        raster_block[nodata_mask] = nodata
+
+    return raster_block
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Read window
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Read window" is a function that reads a window of all bands from an open raster or a memory-mapped raster cache.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a window from a raster or a raster cache
+def read_window(raster, window, bands=None):
+    """
+    Description: reads a window of all bands or of selected bands as a (band count, height, width) array, copying it from the page cache for arrays created by cache_raster and decoding it for rasterio datasets
+    Inputs: 'raster' -- an open rasterio dataset or a memory-mapped array returned by np.load for a file created by cache_raster
+            'window' -- a rasterio window on the grid of the raster
+            'bands' -- an optional list of zero-based band positions to read instead of all bands
+    Returned Value: Returns a numpy array of the window
+    Preconditions: windows must lie within the raster
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Read rasterio datasets
+    if not isinstance(raster, np.ndarray):
+        if bands is None:
+            return raster.read(window=window, masked=False)
+        return raster.read([band + 1 for band in bands], window=window, masked=False)
+
+    # Copy window from memory-mapped array
+    row_off, col_off = int(window.row_off), int(window.col_off)
+    band_slice = slice(None) if bands is None else bands
+    return np.array(raster[band_slice, row_off:row_off + int(window.height), col_off:col_off + int(window.width)])
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Record build
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Record build" is a function that writes the build manifest for a completed output.
+# ---------------------------------------------------------------------------
+
+# Define a function to record a completed build
+def record_build(output, inputs, parameters, method='stat'):
+    """
+    Description: writes a manifest of the inputs and parameters of a completed output next to the output
+    Inputs: 'output' -- a path to a completed output file
+            'inputs' -- a path or list of paths to input files
+            'parameters' -- a dictionary of processing parameters
+            'method' -- the fingerprint method passed to file_fingerprint
+    Returned Value: None
+    Preconditions: must be called only after the output has been completely written and closed
+    """
+
+    # Import packages
+    import json
+    import os
+    from lfutils.build_state import build_state
+
+    # Write manifest through a temporary file so that an interrupted write is not read as complete
+    manifest_file = output + '.build.json'
+    temporary_file = manifest_file + '.tmp'
+    with open(temporary_file, 'w') as file:
+        json.dump(build_state(inputs, parameters, method), file, indent=2)
+    os.replace(temporary_file, manifest_file)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Rule layers
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Rule layers" is a function that lists the layers referenced by the rules of an ordered rule table that can still assign a class in a block.
+# ---------------------------------------------------------------------------
+
+# Define a function to list the layers needed by rules that can still fire
+def rule_layers(compiled_rules, out_block):
+    """
+    Description: follows rules in order from the classes present in a block, treating a rule as able to fire when it has no source classes or when one of its source classes is present or assigned by an earlier rule that can fire, and lists the layers referenced by those rules
+    Inputs: 'compiled_rules' -- a list of rules returned by compile_rules
+            'out_block' -- a numpy array of current classes
+    Returned Value: Returns a list of layer names in order of first use
+    Preconditions: rules that cannot fire do not change the block, so their layers need not be read
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Find source classes present in the block
+    source_classes = set(source for rule in compiled_rules if rule['sources'] is not None for source in rule['sources'])
+    live_classes = set(source for source in source_classes if np.any(out_block == source))
+
+    # List layers of rules that can fire in order
+    layer_names = []
+    for rule in compiled_rules:
+        if rule['sources'] is not None and live_classes.isdisjoint(rule['sources']):
+            continue
+        live_classes.add(rule['class'])
+        for condition in rule['conditions']:
+            for layer_name, compare, operand in condition:
+                for name in [layer_name] + ([operand[1]] if operand[0] == 'layer' else []):
+                    if name not in layer_names:
+                        layer_names.append(name)
+
+    return layer_names
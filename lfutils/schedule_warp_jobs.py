@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Schedule warp jobs
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation. Calling scripts must guard processing with if __name__ == '__main__'.
+# Description: "Schedule warp jobs" is a function that runs independent warp jobs largest first in a process pool under a memory ceiling.
+# ---------------------------------------------------------------------------
+
+# Define a function to schedule warp jobs
+def schedule_warp_jobs(warp_jobs, worker_count, worker_cache, memory_limit):
+    """
+    Description: runs independent warp jobs in order of decreasing input size, starting jobs only while their estimated memory fits under a total ceiling, and reports per-job throughput and metrics
+    Inputs: 'warp_jobs' -- a list of job dictionaries accepted by warp_job, optionally with a 'memory' estimate in MB
+            'worker_count' -- an integer number of worker processes, where 1 runs jobs serially in the current process
+            'worker_cache' -- an integer GDAL cache size in MB for each worker
+            'memory_limit' -- an integer total memory ceiling in MB for concurrently running jobs
+    Returned Value: Returns a list of job result dictionaries
+    Preconditions: jobs must not depend on the outputs of other jobs in the same list
+    """
+
+    # Import packages
+    import time
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import wait
+    from akutils import end_timing
+    from lfutils.set_gdal_cache import set_gdal_cache
+    from lfutils.warp_job import warp_job
+    from lfutils.warp_job_size import warp_job_size
+    from lfutils.write_metrics import write_metrics
+
+    # Return if there are no jobs to run
+    if len(warp_jobs) == 0:
+        return []
+
+    # Order jobs by decreasing input size
+    job_sizes = {job['name']: warp_job_size(job) for job in warp_jobs}
+    pending = sorted(warp_jobs, key=lambda job: job_sizes[job['name']], reverse=True)
+
+    # Define a function to estimate job memory in MB
+    def job_memory(job):
+        warp_memory = job['options'].get('warpMemoryLimit', 64)
+        return job.get('memory', worker_cache + warp_memory)
+
+    # Define a function to report job throughput and write job metrics
+    def report(result, count):
+        write_metrics(result['metrics'])
+        elapsed = max(result['elapsed'], 0.001)
+        input_size = job_sizes[result['name']] / (1024 * 1024)
+        print(f'\tCompleted {result["name"]} by {result["method"]} ({count} of {len(warp_jobs)}) '
+              f'in {round(elapsed, 1)} seconds: '
+              f'{round(input_size / elapsed, 1)} MB/s input, '
+              f'{round(result["pixels"] / elapsed / 1000000, 1)} megapixels/s output.')
+
+    print(f'Running {len(warp_jobs)} warp jobs on {worker_count} workers...')
+    iteration_start = time.time()
+    results = []
+
+    # Run jobs serially in the current process
+    if worker_count <= 1:
+        set_gdal_cache(worker_cache)
+        for job in pending:
+            results.append(warp_job(job))
+            report(results[-1], len(results))
+        end_timing(iteration_start)
+        return results
+
+    # Run jobs in a process pool, starting the largest pending job that fits under the memory ceiling
+    with ProcessPoolExecutor(max_workers=worker_count,
+                             initializer=set_gdal_cache,
+                             initargs=(worker_cache,)) as executor:
+        running = {}
+        while len(pending) > 0 or len(running) > 0:
+            used_memory = sum(job_memory(job) for job in running.values())
+            while len(pending) > 0 and len(running) < worker_count:
+                fitting = [job for job in pending if used_memory + job_memory(job) <= memory_limit]
+                if len(fitting) == 0 and len(running) > 0:
+                    break
+                job = fitting[0] if len(fitting) > 0 else pending[0]
+                pending.remove(job)
+                running[executor.submit(warp_job, job)] = job
+                used_memory += job_memory(job)
+            done, not_done = wait(running.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                results.append(future.result())
+                report(results[-1], len(results))
+    end_timing(iteration_start)
+
+    return results
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Set GDAL cache
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Set GDAL cache" is a function that sets the GDAL block cache size for the current process.
+# ---------------------------------------------------------------------------
+
+# Define a function to set the GDAL cache size
+def set_gdal_cache(cache_size):
+    """
+    Description: sets the GDAL block cache size for the current process, used to initialize pool workers
+    Inputs: 'cache_size' -- an integer cache size in MB
+    Returned Value: None
+    Preconditions: must be called in the process that will run the GDAL operations
+    """
+
+    # Import packages
+    from osgeo import gdal
+
+    # Set the cache size in bytes
+    gdal.SetCacheMax(int(cache_size) * 1024 * 1024)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Standardized path
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Standardized path" is a function that resolves a standardized input to its GeoTIFF or warped VRT file.
+# ---------------------------------------------------------------------------
+
+# Define a function to resolve standardized input paths
+def standardized_path(raster_path):
+    """
+    Description: resolves a standardized raster to the most recently written of its GeoTIFF or warped VRT versions
+    Inputs: 'raster_path' -- a path to a standardized raster with or without a file extension
+    Returned Value: Returns the path of the existing GeoTIFF or VRT, or the GeoTIFF path if neither exists
+    Preconditions: standardized rasters must be written as .tif or .vrt files
+    """
+
+    # Import packages
+    import os
+
+    # Find existing versions of the raster
+    base_path = os.path.splitext(raster_path)[0]
+    candidates = [base_path + '.tif', base_path + '.vrt']
+    existing = [candidate for candidate in candidates if os.path.exists(candidate)]
+
+    # Return the most recently modified version
+    if len(existing) == 0:
+        return candidates[0]
+    return max(existing, key=os.path.getmtime)
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Start metrics
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Start metrics" is a function that records the wall and CPU clocks at the start of a processing job or stage.
+# ---------------------------------------------------------------------------
+
+# Define a function to start job metrics
+def start_metrics():
+    """
+    Description: records the wall clock and process CPU time at the start of a job or stage
+    Inputs: None
+    Returned Value: Returns a dictionary of start times to pass to collect_metrics
+    Preconditions: must be called in the process that runs the job
+    """
+
+    # Import packages
+    import time
+
+    return {'wall': time.time(), 'cpu': time.process_time()}
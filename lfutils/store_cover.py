@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Store cover
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Store cover" is a function that converts a calculated cover block to the storage type of its output raster.
+# ---------------------------------------------------------------------------
+
+# Define a function to convert a cover block for storage
+def store_cover(raster_block, storage):
+    """
+    Description: converts a calculated block to uint8 storage with 255 as no data, truncating decimals as int16 storage does
+    Inputs: 'raster_block' -- a numpy array of calculated values with int16 no data
+            'storage' -- 'uint8' to convert the block or 'int16' to return it unchanged
+    Returned Value: Returns a numpy array ready to write to the output raster
+    Preconditions: values outside 0 to 254, including int16 no data, are stored as 255
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Return block unchanged for int16 storage
+    if storage != 'uint8':
+        return raster_block
+
+    # Truncate decimals and set values outside the uint8 range to no data
+    if np.issubdtype(raster_block.dtype, np.floating):
+        raster_block = np.trunc(raster_block)
+    raster_block = np.where((raster_block < 0) | (raster_block > 254), 255, raster_block)
+
+    return raster_block.astype(np.uint8)
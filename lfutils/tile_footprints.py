@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Tile footprints
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Tile footprints" is a function that maintains a cached index of the bounds of the raster tiles in a folder.
+# ---------------------------------------------------------------------------
+
+# Define a function to index tile footprints
+def tile_footprints(tile_folder, index_file):
+    """
+    Description: reads the bounds of every tif tile in a folder, reusing cached bounds for tiles whose size and modification time are unchanged
+    Inputs: 'tile_folder' -- a path to a folder of raster tiles
+            'index_file' -- a path to a json file that caches the tile bounds between runs
+    Returned Value: Returns a dictionary of tile paths and bounds as [xmin, ymin, xmax, ymax]
+    Preconditions: tiles must share a coordinate system with the bounds they are queried against
+    """
+
+    # Import packages
+    import glob
+    import json
+    import os
+    import rasterio
+    from lfutils.file_fingerprint import file_fingerprint
+
+    # Read cached index
+    cached_tiles = {}
+    if os.path.exists(index_file):
+        with open(index_file) as file:
+            cached_tiles = json.load(file)
+
+    # Read bounds only for new or changed tiles
+    tile_index = {}
+    changed = False
+    for tile_path in sorted(glob.glob(os.path.join(tile_folder, '*.tif'))):
+        tile_path = os.path.abspath(tile_path)
+        fingerprint = file_fingerprint(tile_path)
+        cached_tile = cached_tiles.get(tile_path)
+        if (cached_tile is not None
+                and cached_tile['size'] == fingerprint['size']
+                and cached_tile['mtime'] == fingerprint['mtime']):
+            tile_index[tile_path] = cached_tile
+        else:
+            with rasterio.open(tile_path) as tile_raster:
+                tile_bounds = list(tile_raster.bounds)
+            tile_index[tile_path] = {'size': fingerprint['size'],
+                                     'mtime': fingerprint['mtime'],
+                                     'bounds': tile_bounds}
+            changed = True
+    if len(tile_index) != len(cached_tiles):
+        changed = True
+
+    # Write index through a temporary file so that an interrupted write is not read as complete
+    if changed == True:
+        os.makedirs(os.path.dirname(os.path.abspath(index_file)), exist_ok=True)
+        temporary_file = index_file + '.tmp'
+        with open(temporary_file, 'w') as file:
+            json.dump(tile_index, file, indent=2)
+        os.replace(temporary_file, index_file)
+
+    return {tile_path: tile['bounds'] for tile_path, tile in tile_index.items()}
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Tile warp jobs
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Tile warp jobs" is a function that splits a mosaicking warp job into independent jobs for tiles of the output grid.
+# ---------------------------------------------------------------------------
+
+# Define a function to split a warp job into output tiles
+def tile_warp_jobs(job, tile_size, tile_folder, footprints):
+    """
+    Description: splits the output grid of a warp job into square tiles and creates a warp job for each tile that reads only the inputs overlapping it
+    Inputs: 'job' -- a job dictionary accepted by warp_job with outputBounds, xRes, and yRes options
+            'tile_size' -- an integer tile width and height in output cells
+            'tile_folder' -- a path to the folder for tile outputs, which is created if it does not exist
+            'footprints' -- a dictionary of input paths and bounds as [xmin, ymin, xmax, ymax] returned by tile_footprints
+    Returned Value: Returns a list of tile job dictionaries, omitting tiles that no input overlaps
+    Preconditions: tile jobs can run in any order; their outputs are assembled with mosaic_tiles
+    """
+
+    # Import packages
+    import os
+
+    # Calculate output grid with the rounding used by gdal.Warp
+    options = job['options']
+    xmin, ymin, xmax, ymax = options['outputBounds']
+    x_res = abs(options['xRes'])
+    y_res = abs(options['yRes'])
+    width = int((xmax - xmin) / x_res + 0.5)
+    height = int((ymax - ymin) / y_res + 0.5)
+    inputs = job['inputs']
+    if isinstance(inputs, str):
+        inputs = [inputs]
+
+    # Create a job for each tile that overlaps an input
+    os.makedirs(tile_folder, exist_ok=True)
+    output_name = os.path.splitext(os.path.basename(job['output']))[0]
+    tile_jobs = []
+    for row in range(0, height, tile_size):
+        for col in range(0, width, tile_size):
+            tile_bounds = [xmin + col * x_res,
+                           ymax - min(row + tile_size, height) * y_res,
+                           xmin + min(col + tile_size, width) * x_res,
+                           ymax - row * y_res]
+            tile_inputs = [raster_input for raster_input in inputs
+                           if footprints[raster_input][0] < tile_bounds[2]
+                           and footprints[raster_input][2] > tile_bounds[0]
+                           and footprints[raster_input][1] < tile_bounds[3]
+                           and footprints[raster_input][3] > tile_bounds[1]]
+            if len(tile_inputs) == 0:
+                continue
+            tile_index = f'{row // tile_size}_{col // tile_size}'
+            tile_jobs.append({'name': job['name'] + '_' + tile_index,
+                              'output': os.path.join(tile_folder, output_name + '_' + tile_index + '.tif'),
+                              'inputs': tile_inputs,
+                              'options': {**options, 'outputBounds': tile_bounds}})
+
+    return tile_jobs
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Tune windows
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Tune windows" is a function that benchmarks candidate window shapes against the layouts and codecs of the inputs of a block loop and selects the fastest, caching the choice between runs.
+# ---------------------------------------------------------------------------
+
+# Define a function to select the fastest window shape for a set of inputs
+def tune_windows(reference_raster, input_files, candidate_shapes=None, max_pixels=1048576, sample_size=2048,
+                 repeats=2):
+    """
+    Description: times reads of all inputs over a sample region of the grid with each candidate window shape and returns the shape with the highest megapixels per second, reusing choices cached in a json index next to the reference raster until the layouts of the inputs change
+    Inputs: 'reference_raster' -- an open rasterio dataset on the grid of the block loop
+            'input_files' -- a list of raster paths read in each block
+            'candidate_shapes' -- an optional list of (height, width) window shapes, by default multiples of the reference block shape and full-width strips
+            'max_pixels' -- the largest number of cells in a default candidate window, which bounds block memory
+            'sample_size' -- the height and width in cells of the central sample region that is read for each candidate
+            'repeats' -- the number of timed reads of each candidate, of which the fastest is kept
+    Returned Value: Returns a tuple of window height and width
+    Preconditions: inputs must share the grid of the reference raster; outputs written with the chosen windows should share the block layout of the reference raster so that writes remain block aligned
+    """
+
+    # Import packages
+    import hashlib
+    import json
+    import os
+    import time
+    import rasterio
+    from rasterio.windows import Window
+
+    # Define default candidates as multiples of the reference block shape
+    block_height, block_width = reference_raster.block_shapes[0]
+    raster_height = reference_raster.height
+    raster_width = reference_raster.width
+    if candidate_shapes is None:
+        candidate_shapes = [(block_height, block_width)]
+        for size in [256, 512, 1024, 2048]:
+            candidate_shapes.append((min(-(-size // block_height) * block_height, raster_height),
+                                     min(-(-size // block_width) * block_width, raster_width)))
+        for size in [64, 256, 1024]:
+            candidate_shapes.append((min(-(-size // block_height) * block_height, raster_height), raster_width))
+        candidate_shapes = [shape for shape in candidate_shapes if shape[0] * shape[1] <= max_pixels] \
+                           or [(block_height, block_width)]
+    candidate_shapes = list(dict.fromkeys(tuple(int(value) for value in shape) for shape in candidate_shapes))
+    if len(candidate_shapes) == 1:
+        return candidate_shapes[0]
+
+    # Describe the layouts and codecs of the inputs
+    input_layouts = []
+    for input_file in input_files:
+        with rasterio.open(input_file) as input_raster:
+            input_layouts.append([os.path.abspath(input_file), input_raster.width, input_raster.height,
+                                  input_raster.count, list(input_raster.dtypes), input_raster.block_shapes[0],
+                                  str(input_raster.compression), str(input_raster.interleaving)])
+    tuning_key = hashlib.sha256(json.dumps([raster_width, raster_height, candidate_shapes, input_layouts],
+                                           default=str).encode()).hexdigest()
+
+    # Return cached choice if the input layouts are unchanged
+    index_file = reference_raster.name + '.windows.json'
+    tuning_index = {}
+    if os.path.exists(index_file):
+        try:
+            with open(index_file) as file:
+                tuning_index = json.load(file)
+        except ValueError:
+            tuning_index = {}
+    if tuning_key in tuning_index:
+        return tuple(tuning_index[tuning_key]['shape'])
+
+    # Define central sample region
+    sample_height = min(sample_size, raster_height)
+    sample_width = min(sample_size, raster_width)
+    sample_row = (raster_height - sample_height) // 2
+    sample_col = (raster_width - sample_width) // 2
+
+    # Define a function to list the windows of a shape that intersect the sample region
+    def sample_windows(window_height, window_width):
+        window_list = []
+        for row_off in range(sample_row // window_height * window_height, sample_row + sample_height, window_height):
+            for col_off in range(sample_col // window_width * window_width, sample_col + sample_width,
+                                 window_width):
+                window_list.append(Window(col_off, row_off,
+                                          min(window_width, raster_width - col_off),
+                                          min(window_height, raster_height - row_off)))
+        return window_list
+
+    # Define a function to read all inputs for a list of windows
+    def read_windows(window_list):
+        pixel_count = 0
+        input_rasters = [rasterio.open(input_file) for input_file in input_files]
+        try:
+            for window in window_list:
+                for input_raster in input_rasters:
+                    input_window = window.intersection(Window(0, 0, input_raster.width, input_raster.height))
+                    input_raster.read(window=input_window, masked=False)
+                    pixel_count += int(input_window.width) * int(input_window.height) * input_raster.count
+        finally:
+            for input_raster in input_rasters:
+                input_raster.close()
+        return pixel_count
+
+    # Warm the operating system cache so that candidates are timed on decoding rather than disk order
+    print(f'Tuning block windows over {len(candidate_shapes)} candidate shapes...')
+    read_windows(sample_windows(block_height, block_width))
+
+    # Time candidates on freshly opened datasets
+    candidate_rates = {}
+    for window_height, window_width in candidate_shapes:
+        best_rate = 0
+        for repeat in range(repeats):
+            read_start = time.perf_counter()
+            pixel_count = read_windows(sample_windows(window_height, window_width))
+            best_rate = max(best_rate, pixel_count / 1000000 / max(time.perf_counter() - read_start, 1e-9))
+        candidate_rates[f'{window_height}x{window_width}'] = round(best_rate, 2)
+    window_shape = max(candidate_shapes, key=lambda shape: candidate_rates[f'{shape[0]}x{shape[1]}'])
+    print(f'\tSelected {window_shape[0]} by {window_shape[1]} windows '
+          f'({candidate_rates[f"{window_shape[0]}x{window_shape[1]}"]} megapixels per second)')
+
+    # Cache choice through a temporary file so that an interrupted write is not read as complete, skipping read-only folders
+    tuning_index[tuning_key] = {'shape': list(window_shape), 'rates': candidate_rates}
+    temporary_file = f'{index_file}.{os.getpid()}.tmp'
+    try:
+        with open(temporary_file, 'w') as file:
+            json.dump(tuning_index, file)
+        os.replace(temporary_file, index_file)
+    except OSError:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+
+    return window_shape
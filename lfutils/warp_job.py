@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Warp job
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Warp job" is a function that runs a single gdal.Warp operation described by a job dictionary.
+# ---------------------------------------------------------------------------
+
+# Define a function to run a warp job
+def warp_job(job):
+    """
+    Description: warps one or more input rasters to an output raster, copying jobs on pixel-aligned grids and aggregating average jobs on integer-factor aligned grids without the general warper
+    Inputs: 'job' -- a dictionary with 'name', 'output', 'inputs', and 'options' keys, where 'options' are keyword arguments for gdal.Warp
+    Returned Value: Returns a dictionary with the job name, processing method, elapsed seconds, output pixel count, and metrics record
+    Preconditions: inputs must be readable by GDAL; incomplete outputs are removed if the warp fails and completed outputs are recorded with record_build
+    """
+
+    # Import packages
+    import os
+    import time
+    from osgeo import gdal
+    from lfutils.aggregate_job import aggregate_job
+    from lfutils.collect_metrics import collect_metrics
+    from lfutils.copy_job import copy_job
+    from lfutils.grid_alignment import grid_alignment
+    from lfutils.record_build import record_build
+    from lfutils.start_metrics import start_metrics
+
+    # Raise GDAL errors as exceptions so that failures reach the parent process
+    gdal.UseExceptions()
+
+    # Warp inputs to output
+    job_start = time.time()
+    metrics_start = start_metrics()
+    try:
+        alignment = None
+        if job['options'].get('resampleAlg', 'near') in ['near', 'average']:
+            alignment = grid_alignment(job)
+        if alignment is not None and alignment['factor'] == 1:
+            method = 'copy'
+            output_pixels = copy_job(job, alignment)
+        elif alignment is not None and job['options'].get('resampleAlg') == 'average':
+            method = 'aggregate'
+            output_pixels = aggregate_job(job, alignment)
+        else:
+            method = 'warp'
+            output_dataset = gdal.Warp(job['output'], job['inputs'], **job['options'])
+            output_pixels = output_dataset.RasterXSize * output_dataset.RasterYSize
+            output_dataset = None
+    except Exception:
+        if os.path.exists(job['output']):
+            os.remove(job['output'])
+        raise
+
+    # Record completed output
+    record_build(job['output'], job['inputs'], job['options'])
+
+    return {'name': job['name'],
+            'method': method,
+            'elapsed': time.time() - job_start,
+            'pixels': output_pixels,
+            'metrics': collect_metrics(job['name'], job['output'], job['inputs'], metrics_start, pixels=output_pixels)}
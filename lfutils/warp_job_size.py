@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Warp job size
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Warp job size" is a function that calculates the total size of the input files of a warp job.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate the input size of a warp job
+def warp_job_size(job):
+    """
+    Description: sums the file sizes of the inputs of a warp job
+    Inputs: 'job' -- a job dictionary accepted by warp_job
+    Returned Value: Returns the total input size in bytes
+    Preconditions: missing inputs are counted as zero bytes
+    """
+
+    # Import packages
+    import os
+
+    # Sum input file sizes
+    inputs = job['inputs']
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    return sum(os.path.getsize(input_file) for input_file in inputs if os.path.exists(input_file))
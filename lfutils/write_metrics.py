@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Write metrics
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Must be executed in a Python 3.9+ installation.
+# Description: "Write metrics" is a function that appends a metrics record as a json line next to the output it describes.
+# ---------------------------------------------------------------------------
+
+# Define a function to write job metrics
+def write_metrics(metrics, metrics_file=None):
+    """
+    Description: appends a metrics record to a json lines file, by default build_metrics.jsonl in the folder of the output
+    Inputs: 'metrics' -- a dictionary returned by collect_metrics
+            'metrics_file' -- an optional path to the json lines file
+    Returned Value: None
+    Preconditions: records from pool workers should be returned to and written by the parent process
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Append record
+    if metrics_file is None:
+        metrics_file = os.path.join(os.path.dirname(metrics['output']), 'build_metrics.jsonl')
+    with open(metrics_file, 'a') as file:
+        file.write(json.dumps(metrics) + '\n')
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test apply rules
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Execute with pytest in Python 3.9+.
+# Description: "Test apply rules" confirms that the key rule table applied with apply_rules matches the original chain of np.where statements of the programmatic key on random blocks.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import apply_rules, compile_rules
+
+# Set no data value
+nodata = -32768
+
+# Define rule table
+rules_input = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '02_programmatic_key', 'parse_rules.json')
+
+# Define layers read by the key
+layer_names = [
+    'area', 'above', 'biomes', 'zones', 'subboreal', 'correction', 'elevation', 'alnus', 'betshr', 'contre',
+    'dectre', 'dryas', 'erivag', 'evrshr', 'lichen', 'salshr', 'sphagn', 'wetsed', 'picratio', 'picsum',
+    'decratio', 'ndshrub', 'eridwarf', 'wetland', 'picwet', 'herbac', 'vegetation']
+
+
+# Define a function to apply the original programmatic key as a chain of np.where statements
+def reference_key(blocks):
+    area_block = blocks['area']
+    above_block = blocks['above']
+    biomes_block = blocks['biomes']
+    zones_block = blocks['zones']
+    subboreal_block = blocks['subboreal']
+    correction_block = blocks['correction']
+    elevation_block = blocks['elevation']
+    alnus_block = blocks['alnus']
+    betshr_block = blocks['betshr']
+    contre_block = blocks['contre']
+    dectre_block = blocks['dectre']
+    dryas_block = blocks['dryas']
+    erivag_block = blocks['erivag']
+    evrshr_block = blocks['evrshr']
+    lichen_block = blocks['lichen']
+    salshr_block = blocks['salshr']
+    sphagn_block = blocks['sphagn']
+    wetsed_block = blocks['wetsed']
+    picratio_block = blocks['picratio']
+    picsum_block = blocks['picsum']
+    decratio_block = blocks['decratio']
+    ndshrub_block = blocks['ndshrub']
+    eridwarf_block = blocks['eridwarf']
+    wetland_block = blocks['wetland']
+    picwet_block = blocks['picwet']
+    herbac_block = blocks['herbac']
+    vegetation_block = blocks['vegetation']
+
+    # Set base value
+    out_block = np.where(area_block == 1, 253, nodata)
+
+    #### 1. MAJOR BREAKS
+
+    # 1.17 Mesic Alder (field value >= 50)
+    out_block = np.where((out_block == 253) & (alnus_block >= 36),
+                         17, out_block)
+    # 1.254 Coniferous trees dominant (field value >= 5 / 5)
+    out_block = np.where((out_block == 253) & (picsum_block >= 8)
+                         & ((biomes_block == 1) | (biomes_block == 2) | (biomes_block == 3)),
+                         254, out_block)
+    out_block = np.where((out_block == 253)
+                         & ((contre_block >= 7) & (picsum_block >= 1))
+                         & ((zones_block == 5) | (zones_block == 7)),
+                         254, out_block)
+    # 1.16 Deciduous trees dominant
+    out_block = np.where((out_block == 253) & (dectre_block >= 24) & (decratio_block >= 55),
+                         16, out_block)  # field value >= 30
+    out_block = np.where((out_block == 253) & (dectre_block >= 17) & (decratio_block >= 70)
+                         & (dectre_block >= (ndshrub_block * 0.5)),
+                         16, out_block)  # field value >= 15
+    out_block = np.where((out_block == 254) & (dectre_block >= 17) & (decratio_block >= 70),
+                         16, out_block)  # field value >= 15
+    # 1.32 Lichens are dominant or co-dominant
+    out_block = np.where((out_block == 253) & (lichen_block >= 16) & (erivag_block < 19),
+                         32, out_block)  # field value >= 20 / 20
+    out_block = np.where((out_block == 253) & (lichen_block >= 27),
+                         32, out_block)  # field value >= 40
+
+    #### 2. SPRUCE WOODLAND
+
+    # 2.1 Spruce-lichen woodland
+    out_block = np.where((out_block == 254) & ((contre_block < 35) | (picsum_block < 27)) & (lichen_block >= 15),
+                         1, out_block)  # field value < 40 / < 40 / >= 20
+    out_block = np.where((out_block == 254) & ((contre_block < 35) | (picsum_block < 27)) & (lichen_block >= 8)
+                         & ((zones_block == 5) | (zones_block == 7)),
+                         1, out_block)  # field value < 40 / < 40 / >= 5
+
+    # 2.2 White spruce woodland (field value < 15 / 20)
+    out_block = np.where((out_block == 254) & (picratio_block >= 60)
+                         & ((contre_block < 15) | (picsum_block < 16)),
+                         2, out_block)
+
+    # 2.3 White spruce-hardwood woodland (field value >= 5 & < 15)
+    out_block = np.where((out_block == 2) & ((dectre_block >= 12) & (dectre_block < 17)),
+                         3, out_block)
+
+    # 2.4 Black spruce woodland (field value < 15 / 20)
+    out_block = np.where((out_block == 254) & (picratio_block <= 40)
+                         & ((contre_block < 15) | (picsum_block < 16)),
+                         4, out_block)
+
+    # 2.5 Black spruce-hardwood woodland (field value >= 5 & < 15)
+    out_block = np.where((out_block == 4) & ((dectre_block >= 12) & (dectre_block < 17)),
+                         5, out_block)
+
+    # 2.6 Mixed spruce woodland (field value < 15 / 20)
+    out_block = np.where((out_block == 254) & (picratio_block > 40)
+                         & ((contre_block < 15) | (picsum_block < 16)),
+                         6, out_block)
+
+    # 2.7 Mixed spruce-hardwood woodland (field value >= 5 & < 15)
+    out_block = np.where((out_block == 6) & ((dectre_block >= 12) & (dectre_block < 17)),
+                         7, out_block)
+
+    #### 3. SPRUCE FOREST TYPES
+
+    # 3.8 White spruce is dominant
+    out_block = np.where((out_block == 254) & (picratio_block >= 60),
+                         8, out_block)
+
+    # 3.9a Black spruce is dominant
+    out_block = np.where((out_block == 254) & (picratio_block <= 40),
+                         9, out_block)
+
+    # 3.10 Mixed spruce
+    out_block = np.where((out_block == 254) & (picratio_block > 40),
+                         10, out_block)
+
+    #### 4. MIXED SPRUCE-DECIDUOUS TYPES
+    # 4.11 Deciduous trees are co-dominant with white spruce
+    out_block = np.where((out_block == 8) & (decratio_block >= 40),
+                         11, out_block)
+
+    # 4.12 Deciduous trees are co-dominant with black spruce
+    out_block = np.where((out_block == 9) & (decratio_block >= 40),
+                         12, out_block)
+
+    # 4.13 Deciduous trees are co-dominant with mixed spruce
+    out_block = np.where((out_block == 10) & (decratio_block >= 40),
+                         13, out_block)
+
+    # Correction: narrow the black and mixed spruce woodland types
+    out_block = np.where(((out_block == 4) | (out_block == 5)) & (contre_block < 10),
+                         253, out_block)
+    out_block = np.where(((out_block == 6) | (out_block == 7)) & (contre_block < 10),
+                         253, out_block)
+
+    #### 5. BLACK SPRUCE WET TYPES
+    # 5.14 Black spruce-tussock woodland
+    out_block = np.where(((out_block == 4) | (out_block == 6) | (out_block == 9) | (out_block == 10))
+                         & (erivag_block >= 23),
+                         14, out_block)  # field value >= 30
+    out_block = np.where(((out_block == 4) | (out_block == 6) | (out_block == 9) | (out_block == 10))
+                         & (erivag_block >= 16) & (ndshrub_block < 35),
+                         14, out_block)  # field value >= 15 / 35
+
+    # 5.15 Black spruce peatland (field value >= 8 / < 60)
+    out_block = np.where(((out_block == 4) | (out_block == 6) | (out_block == 9) | (out_block == 10))
+                         & (picwet_block >= 8) & (salshr_block < 34),
+                         15, out_block)
+
+    # Correction: black spruce wet types are coniferous (black spruce) forest (field value >= 40 / 40)
+    out_block = np.where(((out_block == 14) | (out_block == 15)) & ((contre_block >= 35) | (picsum_block >= 27)),
+                         9, out_block)
+
+    # Correction: correct black-mixed spruce beyond black spruce range
+    out_block = np.where(((out_block == 4) | (out_block == 6)) & (correction_block == 1),
+                         2, out_block)
+    out_block = np.where(((out_block == 5) | (out_block == 7)) & (correction_block == 1),
+                         3, out_block)
+    out_block = np.where(((out_block == 9) | (out_block == 10)) & (correction_block == 1),
+                         8, out_block)
+    out_block = np.where(((out_block == 12) | (out_block == 13)) & (correction_block == 1),
+                         11, out_block)
+    out_block = np.where(((out_block == 14) | (out_block == 15)) & (correction_block == 1),
+                         2, out_block)
+
+    # Correction: correct black spruce tussock in Cook Inlet and Kenai Peninsula
+    out_block = np.where((out_block == 14) & (subboreal_block == 1) & ((zones_block == 2) | (zones_block == 3)),
+                         15, out_block)
+
+    # Correction: correct white spruce in Cook Inlet Wetlands
+    out_block = np.where(((out_block == 2) | (out_block == 3) | (out_block == 8) | (out_block == 11))
+                         & (wetland_block >= 10)
+                         & (subboreal_block == 1) & (zones_block == 3),
+                         253, out_block)
+
+    #### 6. TUSSOCK TUNDRA TYPES
+
+    # 6.19 Low shrub-tussock tundra
+    out_block = np.where((out_block == 253) & (erivag_block >= 23),
+                         19, out_block)
+    out_block = np.where((out_block == 253) & (erivag_block >= 16) & (ndshrub_block < 35),
+                         19, out_block)  # field value >= 15 / < 35
+    out_block = np.where((out_block == 253) & (erivag_block >= 10) & (ndshrub_block < 40)
+                         & ((zones_block == 7) | (zones_block == 8) | (zones_block >= 10)),
+                         19, out_block)  # field value >= 8 / < 40
+
+    # 6.20 Dwarf shrub-tussock tundra (field value < 5)
+    out_block = np.where((out_block == 19) & (ndshrub_block < 8),
+                         20, out_block)
+
+    #### 7. ALDER TYPES
+    # 7.17 Mesic alder (field value >= 20)
+    out_block = np.where((out_block == 253) & (alnus_block >= 18),
+                         17, out_block)
+
+    # 7.18 Wet alder (field value >= 20)
+    out_block = np.where((out_block == 17) & (wetland_block >= 20),
+                         18, out_block)
+
+    # 7.21 Alder and willow are co-dominant (field value >= 15 / 15)
+    out_block = np.where(((out_block == 253) | (out_block == 17) | (out_block == 18))
+                         & (alnus_block >= 14) & (salshr_block >= 13),
+                         21, out_block)
+
+    # 7.22 Alder and willow wet (field value >= 20)
+    out_block = np.where((out_block == 21) & (wetland_block >= 20),
+                         22, out_block)
+
+    #### 8. WILLOW AND BIRCH TYPES
+
+    # 8.23 Mesic willow (field value >= 25)
+    out_block = np.where((out_block == 253) & (salshr_block >= 18),
+                         23, out_block)
+
+    # 8.24 Wet willow (field value >= 20)
+    out_block = np.where((out_block == 23) & (wetland_block >= 20),
+                         24, out_block)
+
+    # 8.26 Mesic birch-willow shrub
+    out_block = np.where((out_block == 23) & (betshr_block >= 16),
+                         26, out_block)  # field value >= 15
+    out_block = np.where((out_block == 253) & (betshr_block >= 16) & (salshr_block >= 15),
+                         26, out_block)  # field value >= 15 / 15
+
+    # 8.27 Wet birch-willow shrub
+    out_block = np.where((out_block == 24) & (betshr_block >= 16),
+                         27, out_block)  # field value >= 15
+    out_block = np.where((out_block == 26) & (wetland_block >= 20),
+                         27, out_block) # field value >= 20
+
+    # 8.25 Wet shrub-sphagnum
+    out_block = np.where(((out_block == 24) | (out_block == 27)) & (sphagn_block >= 15),
+                         25, out_block)  # field value >= 15
+    out_block = np.where((out_block == 19) & (sphagn_block >= 44) & (erivag_block < 23)
+                         & ((zones_block == 12)),
+                         25, out_block)  # field value >= 70
+    out_block = np.where((out_block == 19) & (sphagn_block >= 29)
+                         & (zones_block != 12),
+                         25, out_block)  # field value >= 40
+
+    # 8.28 Mesic birch shrub (field value >= 15)
+    out_block = np.where((out_block == 253) & (betshr_block >= 15),
+                         28, out_block)
+
+    # Correction: correct tussock tundra in Cook Inlet and Kenai Peninsula
+    out_block = np.where(((out_block == 19) | (out_block == 20))
+                         & (subboreal_block == 1) & ((zones_block == 2) | (zones_block == 3)),
+                         25, out_block)
+
+    #### 9. WET SEDGE AND PEATLAND TYPES
+
+    # 9.29 Wetland sedge meadow (field value >= 15)
+    out_block = np.where((out_block == 253) & (wetsed_block >= 18),
+                         29, out_block)
+
+    # 9.30 Peatland
+    out_block = np.where((out_block == 29) & (sphagn_block >= 20),
+                         30, out_block)  # field value >= 20
+    out_block = np.where((out_block == 253) & (sphagn_block >= 15),
+                         30, out_block)  # field value >= 15
+    out_block = np.where((out_block == 20) & (sphagn_block >= 44) & (erivag_block < 23)
+                         & (zones_block == 12),
+                         30, out_block)  # field value >= 70
+    out_block = np.where((out_block == 20) & (sphagn_block >= 29)
+                         & (zones_block != 12),
+                         30, out_block)  # field value >= 40
+
+    # 9.31 Dwarf shrub-sphagnum (field value >= 20 / 15)
+    out_block = np.where((out_block == 30)
+                         & ((evrshr_block >= 17) | (eridwarf_block >= 15)),
+                         31, out_block)
+
+    #### 10. DWARF SHRUB TYPES
+
+    # 10.33 Dwarf shrub-lichen (field value >= 20 / 15 / 15)
+    out_block = np.where((out_block == 32)
+                         & ((evrshr_block >= 15) | (dryas_block >= 12) | (eridwarf_block >= 15)),
+                         33, out_block)
+
+    # 10.34 Ericaceous (dryas) dwarf shrub (field value >= 15 / < 30)
+    out_block = np.where((out_block == 253) & (eridwarf_block >= 15) & (dryas_block < 20),
+                         34, out_block)
+
+    # 10.35 Dryas dwarf shrub (field value >= 15)
+    out_block = np.where((out_block == 253) & (dryas_block >= 12),
+                         35, out_block)
+
+    # Correction: ericaceous shrubs in wet areas should be dwarf-shrub peatlands
+    out_block = np.where((out_block == 34) & (wetland_block >= 10) & (zones_block != 12),
+                         31, out_block)
+
+    # Correction: ericaceous shrubs do not relate to EVT below subalpine in Kenai Peninsula and Cook Inlet
+    out_block = np.where((out_block == 34) &
+                         (elevation_block < 500)
+                         & ((zones_block == 2) | (zones_block == 3)) & (subboreal_block ==1),
+                         253, out_block)
+
+    # Correction: ericaceous shrubs do not relate to EVT below subalpine in boreal
+    out_block = np.where((out_block == 34)
+                         & (elevation_block < 900)
+                         & (biomes_block == 3), 253, out_block)
+
+    #### 11. HERBACEOUS
+
+    # 11.36 Herbaceous mix
+    out_block = np.where((herbac_block >= 40)
+                         & (alnus_block < 10) & (salshr_block < 15) & (dectre_block < 15) & (contre_block < 8)
+                         & (subboreal_block == 1),
+                         36, out_block) # Lowland Kenai Peninsula meadows
+    out_block = np.where((herbac_block >= 25)
+                         & (alnus_block < 10) & (salshr_block < 15) & (dectre_block < 15) & (contre_block < 8)
+                         & (elevation_block >= 1200)
+                         & (biomes_block == 3),
+                         36, out_block) # Talkeetna, Wrangell, and Alaska Range alpine
+    out_block = np.where((herbac_block >= 25)
+                         & (alnus_block < 10) & (salshr_block < 15) & (dectre_block < 15) & (contre_block < 8)
+                         & (elevation_block >= 800)
+                         & (subboreal_block == 1), # Subboreal mountain alpine
+                         36, out_block)  # Talkeetna, Wrangell, and Alaska Range alpine
+    out_block = np.where((out_block == 253) & (herbac_block >= 25),
+                         36, out_block)  # field value >= 25
+    # 9.29 Wetland sedge meadow (field value >= 5)
+    out_block = np.where((out_block == 253) & (wetsed_block >= 11),
+                         29, out_block)
+
+    #### 12. SPARSE OR BARREN
+
+    # 12.37 Sparse vegetation
+    out_block = np.where((out_block == 253) & (vegetation_block < 25) & (above_block == 1),
+                         37, out_block)
+
+    # 12.38 Barren
+    out_block = np.where((out_block == 37) & (vegetation_block <= 10) & (above_block == 1),
+                         38, out_block)
+
+    # Set no data values from area raster to no data
+    out_block = np.where(area_block != 1, nodata, out_block)
+    return out_block
+
+
+# Define a function to create random layer blocks that reach the classes of the key
+def random_blocks(rng, cover_limit, shape=(64, 64)):
+    blocks = {}
+    for layer_name in layer_names:
+        if layer_name in ['area', 'above', 'subboreal', 'correction']:
+            layer_block = rng.choice([0, 1, 1, 1], shape)
+        elif layer_name == 'zones':
+            layer_block = rng.integers(1, 14, shape)
+        elif layer_name == 'biomes':
+            layer_block = rng.integers(1, 5, shape)
+        elif layer_name == 'elevation':
+            layer_block = rng.integers(0, 1600, shape)
+        else:
+            layer_block = rng.integers(0, cover_limit, shape)
+        layer_block = layer_block.astype(np.int16)
+        layer_block[rng.random(shape) < 0.01] = nodata
+        blocks[layer_name] = layer_block
+    return blocks
+
+
+@pytest.mark.parametrize('sparse_fraction, compact_fraction', [(0.0625, 0.5), (0, 0), (1, 0), (1, 1)])
+def test_rule_table_matches_reference(sparse_fraction, compact_fraction):
+    parse_rules = compile_rules(rules_input)
+    rng = np.random.default_rng(0)
+    found_classes = set()
+    for trial in range(40):
+        blocks = random_blocks(rng, [70, 45, 25, 15][trial % 4])
+        reference_block = reference_key(blocks).astype(np.int16)
+        out_block = np.where(blocks['area'] == 1, 253, nodata).astype(np.int16)
+        apply_rules(parse_rules, out_block, blocks, sparse_fraction, compact_fraction)
+        out_block[blocks['area'] != 1] = nodata
+        assert np.array_equal(out_block, reference_block)
+        found_classes.update(np.unique(reference_block).tolist())
+    assert found_classes.issuperset(range(1, 39))
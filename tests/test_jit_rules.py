@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test JIT rules
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Execute with pytest in Python 3.9+. Requires numba.
+# Description: "Test JIT rules" confirms that the compiled per-pixel key matches the vectorized key of apply_rules on random blocks.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import apply_rules, compile_rules, jit_rules, rule_layers
+
+# Skip tests when numba is not installed
+pytest.importorskip('numba')
+
+# Set no data value
+nodata = -32768
+
+# Define rule table
+rules_input = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '02_programmatic_key', 'parse_rules.json')
+
+
+# Define a function to create random blocks for the layers of a rule table
+def random_blocks(rng, compiled_rules, cover_limit, shape=(48, 80)):
+    blocks = {}
+    for layer_name in ['area'] + rule_layers(compiled_rules, np.array([253], dtype=np.int16)):
+        if layer_name in ['area', 'above', 'subboreal', 'correction']:
+            layer_block = rng.choice([0, 1, 1, 1], shape)
+        elif layer_name == 'zones':
+            layer_block = rng.integers(1, 14, shape)
+        elif layer_name == 'biomes':
+            layer_block = rng.integers(1, 5, shape)
+        elif layer_name == 'elevation':
+            layer_block = rng.integers(0, 1600, shape)
+        else:
+            layer_block = rng.integers(0, cover_limit, shape)
+        layer_block = layer_block.astype(np.int16)
+        layer_block[rng.random(shape) < 0.01] = nodata
+        blocks[layer_name] = layer_block
+    return blocks
+
+
+@pytest.mark.parametrize('parallel', [True, False])
+def test_kernel_matches_apply_rules(parallel):
+    parse_rules = compile_rules(rules_input)
+    key_function = jit_rules(parse_rules, parallel=parallel)
+    rng = np.random.default_rng(1)
+    for trial in range(40):
+        blocks = random_blocks(rng, parse_rules, [70, 45, 25, 15][trial % 4])
+        base_block = np.where(blocks['area'] == 1, 253, nodata).astype(np.int16)
+        numpy_block = apply_rules(parse_rules, base_block.copy(), blocks)
+        numba_block = key_function(parse_rules, base_block.copy(), blocks)
+        assert np.array_equal(numpy_block, numba_block)
+
+
+def test_kernel_checks_omitted_layers():
+    parse_rules = compile_rules(rules_input)
+    later_rules = [rule for rule in parse_rules if rule['major'] == False]
+    key_function = jit_rules(later_rules, parallel=False)
+    rng = np.random.default_rng(2)
+    blocks = random_blocks(rng, later_rules, 45)
+    # Omit a layer tested only by spruce rules from a block without spruce classes
+    base_block = np.where(blocks['area'] == 1, 253, nodata).astype(np.int16)
+    partial_blocks = {layer_name: layer_block for layer_name, layer_block in blocks.items() if layer_name != 'correction'}
+    numpy_block = apply_rules(later_rules, base_block.copy(), partial_blocks)
+    numba_block = key_function(later_rules, base_block.copy(), partial_blocks)
+    assert np.array_equal(numpy_block, numba_block)
+    # Raise for the same layer when spruce classes are present
+    base_block[0, 0] = 254
+    with pytest.raises(KeyError):
+        key_function(later_rules, base_block, partial_blocks)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test output profile
+# Author: Alaska Center for Conservation Science
+# Last Updated: 2026-10-17
+# Usage: Execute with pytest in Python 3.9+.
+# Description: "Test output profile" confirms that outputs copied from the profiles of area of interest windows and other virtual rasters are written as GeoTIFFs.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfutils import aoi_bounds, aoi_raster, output_profile
+
+# Set no data value
+nodata = -32768
+
+
+# Define a function to write a tiled input raster on a 30 m grid
+def write_input(raster_path):
+    profile = {'driver': 'GTiff', 'width': 64, 'height': 48, 'count': 1, 'dtype': 'int16', 'nodata': nodata,
+               'crs': 'EPSG:3338', 'transform': from_origin(0, 1440, 30, 30),
+               'tiled': True, 'blockxsize': 16, 'blockysize': 16, 'compress': 'lzw'}
+    values = np.arange(64 * 48, dtype=np.int16).reshape(1, 48, 64)
+    with rasterio.open(raster_path, 'w', **profile) as dst:
+        dst.write(values)
+    return values
+
+
+# Define a function to write a window virtual raster like the area of interest windows of aoi_raster
+def write_window_vrt(raster_path, vrt_path, col_off, row_off, width, height):
+    with rasterio.open(raster_path) as src:
+        xmin, ymax = src.transform * (col_off, row_off)
+        wkt = src.crs.to_wkt()
+    with open(vrt_path, 'w') as file:
+        file.write(f'<VRTDataset rasterXSize="{width}" rasterYSize="{height}">'
+                   f'<SRS>{wkt}</SRS><GeoTransform>{xmin}, 30, 0, {ymax}, 0, -30</GeoTransform>'
+                   f'<VRTRasterBand dataType="Int16" band="1"><NoDataValue>{nodata}</NoDataValue><SimpleSource>'
+                   f'<SourceFilename relativeToVRT="1">{os.path.basename(raster_path)}</SourceFilename>'
+                   f'<SourceBand>1</SourceBand>'
+                   f'<SrcRect xOff="{col_off}" yOff="{row_off}" xSize="{width}" ySize="{height}"/>'
+                   f'<DstRect xOff="0" yOff="0" xSize="{width}" ySize="{height}"/>'
+                   f'</SimpleSource></VRTRasterBand></VRTDataset>')
+
+
+# Define a function to copy a raster through output_profile as the post-processing scripts do
+def copy_through_profile(input_path, output_path):
+    with rasterio.open(input_path) as src:
+        with rasterio.open(output_path, 'w', **output_profile(src, nodata=nodata), BIGTIFF='YES') as dst:
+            for block_index, window in dst.block_windows(1):
+                dst.write(src.read(window=window), window=window)
+    with rasterio.open(output_path) as result:
+        return result.profile, result.read()
+
+
+def test_window_vrt_writes_geotiff(tmp_path):
+    values = write_input(str(tmp_path / 'landfire.tif'))
+    write_window_vrt(str(tmp_path / 'landfire.tif'), str(tmp_path / 'landfire.vrt'), 16, 12, 32, 24)
+    profile, result = copy_through_profile(str(tmp_path / 'landfire.vrt'), str(tmp_path / 'revised.tif'))
+    assert profile['driver'] == 'GTiff'
+    assert profile['tiled'] == True
+    assert profile['compress'] == 'lzw'
+    assert np.array_equal(result, values[:, 12:36, 16:48])
+
+
+def test_tiled_geotiff_keeps_blocks(tmp_path):
+    values = write_input(str(tmp_path / 'landfire.tif'))
+    profile, result = copy_through_profile(str(tmp_path / 'landfire.tif'), str(tmp_path / 'revised.tif'))
+    assert (profile['blockxsize'], profile['blockysize']) == (16, 16)
+    assert np.array_equal(result, values)
+
+
+def test_aoi_raster_writes_geotiff(tmp_path):
+    pytest.importorskip('osgeo')
+    values = write_input(str(tmp_path / 'landfire.tif'))
+    aoi = {'name': 'test', 'bounds': [480, 360, 1440, 1080]}
+    run_bounds = aoi_bounds(str(tmp_path / 'landfire.tif'), aoi)
+    window_input = aoi_raster(str(tmp_path / 'landfire.tif'), aoi, run_bounds)
+    profile, result = copy_through_profile(window_input, str(tmp_path / 'revised.tif'))
+    assert profile['driver'] == 'GTiff'
+    assert np.array_equal(result, values[:, 12:36, 16:48])